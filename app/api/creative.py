@@ -1,7 +1,7 @@
 """Creative processing endpoints for Kargo x Amazon DSP integration."""
 import asyncio
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -84,7 +84,15 @@ async def batch_upload_to_amazon(creative_ids: List[str], advertiser_id: str) ->
                 )
                 
                 # Update database with Amazon creative IDs
-                for (creative, _), upload_response in zip(upload_requests, upload_results):
+                for (creative, _), upload_response in zip(
+                    upload_requests, upload_results, strict=True
+                ):
+                    if upload_response is None:
+                        results["failed"].append({
+                            "creative_id": creative.creative_id,
+                            "error": "Amazon DSP upload failed"
+                        })
+                        continue
                     try:
                         creative.amazon_creative_id = upload_response.creative_id
                         creative.upload_status = upload_response.status
@@ -115,33 +123,43 @@ async def batch_upload_to_amazon(creative_ids: List[str], advertiser_id: str) ->
     return results
 
 
-@router.post("/process", response_model=CreativeProcessResponse)
+class CreativeProcessSlimResponse(BaseModel):
+    """Identifier-only response for creative processing."""
+    creative_id: str
+
+
+@router.post(
+    "/process",
+    response_model=Union[CreativeProcessResponse, CreativeProcessSlimResponse],
+)
 async def process_creative(
     request: CreativeProcessRequest,
+    slim: bool = False,
     db: AsyncSession = Depends(get_db_session),
-) -> CreativeProcessResponse:
+) -> Union[CreativeProcessResponse, CreativeProcessSlimResponse]:
     """
     Process Kargo creative for Amazon DSP integration.
     
     Supports both Phase 1 (DV-only) and Phase 2 (IAS S2S + DV) configurations.
+    With ``slim=true`` only the creative ID is returned, omitting the
+    processed code payload.
     """
     try:
-        async for session in get_db_session():
-            processor = CreativeProcessor()
-            processed_creative = await processor.process_creative(
-                request.creative_config,
-                session
-            )
-            
-            return CreativeProcessResponse(
-                creative_id=processed_creative.creative_id,
-                name=processed_creative.name,
-                format=processed_creative.format,
-                processed_code=processed_creative.processed_code,
-                viewability_config=processed_creative.viewability_config,
-                amazon_dsp_ready=processed_creative.amazon_dsp_ready,
-                processing_metadata=processed_creative.processing_metadata,
-            )
+        processor = CreativeProcessor(db)
+        processed_creative = await processor.process_creative(request.creative_config)
+        
+        if slim:
+            return CreativeProcessSlimResponse(creative_id=processed_creative.creative_id)
+        
+        return CreativeProcessResponse(
+            creative_id=processed_creative.creative_id,
+            name=processed_creative.name,
+            format=processed_creative.format,
+            processed_code=processed_creative.processed_code,
+            viewability_config=processed_creative.viewability_config,
+            amazon_dsp_ready=processed_creative.amazon_dsp_ready,
+            processing_metadata=processed_creative.processing_metadata,
+        )
     except Exception as e:
         logger.error(f"Creative processing failed: {e}", exc_info=True)
         raise HTTPException(
@@ -174,51 +192,48 @@ async def process_creatives_bulk(
 ) -> BulkProcessResponse:
     """Process multiple creatives in bulk with optional Amazon DSP upload."""
     try:
-        async for session in get_db_session():
-            processor = CreativeProcessor()
-            results = []
-            failed_items = []
-            
-            # Process creatives
-            for creative_config in request.creative_configs:
-                try:
-                    processed_creative = await processor.process_creative(
-                        creative_config,
-                        session
-                    )
-                    results.append(CreativeProcessResponse(
-                        creative_id=processed_creative.creative_id,
-                        name=processed_creative.name,
-                        format=processed_creative.format,
-                        processed_code=processed_creative.processed_code,
-                        viewability_config=processed_creative.viewability_config,
-                        amazon_dsp_ready=processed_creative.amazon_dsp_ready,
-                        processing_metadata=processed_creative.processing_metadata,
-                    ))
-                except Exception as e:
-                    logger.warning(f"Failed to process creative {creative_config.name}: {e}")
-                    failed_items.append({
-                        "creative_name": creative_config.name,
-                        "error": str(e)
-                    })
-                    continue
-            
-            # Schedule Amazon DSP upload if requested
-            if request.upload_to_amazon and results:
-                background_tasks.add_task(
-                    batch_upload_to_amazon,
-                    [r.creative_id for r in results],
-                    request.advertiser_id
-                )
+        processor = CreativeProcessor(db)
+        results = []
+        failed_items = []
+        
+        # Process creatives concurrently; failures are reported per item
+        outcomes = await processor.process_creatives(request.creative_configs)
+        
+        for creative_config, outcome in zip(request.creative_configs, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Failed to process creative {creative_config.name}: {outcome}")
+                failed_items.append({
+                    "creative_name": creative_config.name,
+                    "error": str(outcome)
+                })
+                continue
             
-            return BulkProcessResponse(
-                total_processed=len(request.creative_configs),
-                successful=len(results),
-                failed=len(failed_items),
-                results=results,
-                failed_items=failed_items
+            results.append(CreativeProcessResponse(
+                creative_id=outcome.creative_id,
+                name=outcome.name,
+                format=outcome.format,
+                processed_code=outcome.processed_code,
+                viewability_config=outcome.viewability_config,
+                amazon_dsp_ready=outcome.amazon_dsp_ready,
+                processing_metadata=outcome.processing_metadata,
+            ))
+        
+        # Schedule Amazon DSP upload if requested
+        if request.upload_to_amazon and results:
+            background_tasks.add_task(
+                batch_upload_to_amazon,
+                [r.creative_id for r in results],
+                request.advertiser_id
             )
-            
+        
+        return BulkProcessResponse(
+            total_processed=len(request.creative_configs),
+            successful=len(results),
+            failed=len(failed_items),
+            results=results,
+            failed_items=failed_items
+        )
+        
     except Exception as e:
         logger.error(f"Bulk creative processing failed: {e}", exc_info=True)
         raise HTTPException(
@@ -315,13 +330,22 @@ async def get_creative(
 async def list_creatives(
     skip: int = 0,
     limit: int = 100,
+    after: Optional[str] = None,
     db: AsyncSession = Depends(get_db_session),
 ) -> List[ProcessedCreative]:
-    """List all processed creatives with pagination."""
+    """
+    List processed creatives, newest first.
+    
+    Pass the last creative_id of a page as ``after`` to fetch the next one;
+    ``skip`` is still accepted for offset pagination. Combining ``after``
+    with a non-zero ``skip`` is rejected with 400.
+    """
     try:
         processor = CreativeProcessor(db)
-        creatives = await processor.list_processed_creatives(skip=skip, limit=limit)
+        creatives = await processor.list_processed_creatives(skip=skip, limit=limit, after=after)
         return creatives
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to list creatives: {e}", exc_info=True)
         raise HTTPException(
@@ -12,6 +12,7 @@ from app.models.database import get_db_session, check_database_health
 from app.services.amazon_client import get_amazon_dsp_client
 from app.services.kargo_client import get_kargo_client
 from app.utils.logging import health_logger
+from app.utils.error_tracking import get_error_tracker
 from app.utils.metrics import MetricsCollector, REGISTRY
 from prometheus_client import generate_latest
 
@@ -138,6 +139,9 @@ async def metrics_endpoint():
         is_healthy = check["status"] == "healthy"
         MetricsCollector.set_external_service_health(service, is_healthy)
     
+    # Push buffered error counts so the scrape is up to date
+    get_error_tracker().flush_error_metrics()
+    
     # Return Prometheus formatted metrics
     return generate_latest(REGISTRY).decode("utf-8")
 
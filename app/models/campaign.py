@@ -1,7 +1,8 @@
 """Pydantic models for campaign management and bulk operations."""
 from datetime import datetime, date
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, validator
 
@@ -215,48 +216,61 @@ class BulkSheetData(BaseModel):
     total_creatives: int = Field(..., description="Total number of creatives")
 
 
-# Example campaign configuration
-EXAMPLE_CAMPAIGN_CONFIG = CampaignConfig(
-    name="RMI_Q3_2025_HighImpact_Phase1",
-    advertiser_id="123456",
-    goal_kpi=GoalKPI.VIEWABILITY,
-    total_budget=50000.0,
-    start_date=date(2025, 1, 1),
-    end_date=date(2025, 3, 31),
-    phase=CampaignPhase.PHASE_1,
-    viewability_config=ViewabilityConfig(
-        phase="phase_1",
-        vendors=["double_verify"],
-        method="platform_native"
-    ),
-    runway_creatives=[
-        CreativeConfig(
-            name="PMP_Amazon_RMI_Runway_Mobile",
-            format="runway",
-            dimensions="320x50",
-            snippet_url="https://snippet.kargo.com/snippet/dm/81298",
-            device_type="mobile",
-            viewability_config=ViewabilityConfig(
-                phase="phase_1",
-                vendors=["double_verify"],
-                method="platform_native"
+# Example campaign configuration, validated on first access
+@cache
+def _example_campaign_config() -> CampaignConfig:
+    return CampaignConfig(
+        name="RMI_Q3_2025_HighImpact_Phase1",
+        advertiser_id="123456",
+        goal_kpi=GoalKPI.VIEWABILITY,
+        total_budget=50000.0,
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 3, 31),
+        phase=CampaignPhase.PHASE_1,
+        viewability_config=ViewabilityConfig(
+            phase="phase_1",
+            vendors=["double_verify"],
+            method="platform_native"
+        ),
+        runway_creatives=[
+            CreativeConfig(
+                name="PMP_Amazon_RMI_Runway_Mobile",
+                format="runway",
+                dimensions="320x50",
+                snippet_url="https://snippet.kargo.com/snippet/dm/81298",
+                device_type="mobile",
+                viewability_config=ViewabilityConfig(
+                    phase="phase_1",
+                    vendors=["double_verify"],
+                    method="platform_native"
+                )
             )
-        )
-    ],
-    video_creatives=[
-        CreativeConfig(
-            name="PMP_Amazon_RMI_PreRoll_15s",
-            format="enhanced_preroll",
-            dimensions="300x50",
-            snippet_url="https://snippet.kargo.com/snippet/dm/81172",
-            device_type="mobile",
-            duration=15,
-            branded_canvas=True,
-            viewability_config=ViewabilityConfig(
-                phase="phase_1",
-                vendors=["double_verify"],
-                method="vast_wrapped"
+        ],
+        video_creatives=[
+            CreativeConfig(
+                name="PMP_Amazon_RMI_PreRoll_15s",
+                format="enhanced_preroll",
+                dimensions="300x50",
+                snippet_url="https://snippet.kargo.com/snippet/dm/81172",
+                device_type="mobile",
+                duration=15,
+                branded_canvas=True,
+                viewability_config=ViewabilityConfig(
+                    phase="phase_1",
+                    vendors=["double_verify"],
+                    method="vast_wrapped"
+                )
             )
-        )
-    ]
-)
\ No newline at end of file
+        ]
+    )
+
+
+if TYPE_CHECKING:
+    EXAMPLE_CAMPAIGN_CONFIG: CampaignConfig
+
+
+def __getattr__(name: str) -> CampaignConfig:
+    """Build the example campaign on first access instead of at import time."""
+    if name == "EXAMPLE_CAMPAIGN_CONFIG":
+        return _example_campaign_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,10 @@
 """Pydantic models for creative processing and configuration."""
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from functools import cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 
 
 class CreativeFormat(str, Enum):
@@ -35,8 +36,10 @@ class DeviceType(str, Enum):
 
 class ViewabilityConfig(BaseModel):
     """Viewability measurement configuration."""
+    model_config = ConfigDict(frozen=True)
+    
     phase: ViewabilityPhase
-    vendors: List[ViewabilityVendor]
+    vendors: Tuple[ViewabilityVendor, ...]
     method: str = Field(..., description="Measurement method (native, wrapped, s2s)")
     
     # Phase 1 specific
@@ -63,6 +66,8 @@ class ViewabilityConfig(BaseModel):
 
 class CreativeConfig(BaseModel):
     """Configuration for processing a creative."""
+    model_config = ConfigDict(frozen=True)
+    
     name: str = Field(..., description="Creative name")
     format: CreativeFormat = Field(..., description="Creative format type")
     dimensions: str = Field(..., description="Creative dimensions (e.g., '320x50')")
@@ -159,34 +164,56 @@ class CreativeUploadResponse(BaseModel):
     amazon_approval_status: Optional[str] = Field(default=None, description="Amazon approval status")
 
 
-# Example configurations for testing
-EXAMPLE_RUNWAY_CONFIG = CreativeConfig(
-    name="PMP_Amazon_RMI_CORE_Runway_Anim_GE_v2_Mobile",
-    format=CreativeFormat.RUNWAY,
-    dimensions="320x50",
-    snippet_url="https://snippet.kargo.com/snippet/dm/81298",
-    device_type=DeviceType.MOBILE,
-    viewability_config=ViewabilityConfig(
-        phase=ViewabilityPhase.PHASE_1,
-        vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-        method="platform_native"
+# Example configurations for testing, validated on first access
+@cache
+def _example_runway_config() -> CreativeConfig:
+    return CreativeConfig(
+        name="PMP_Amazon_RMI_CORE_Runway_Anim_GE_v2_Mobile",
+        format=CreativeFormat.RUNWAY,
+        dimensions="320x50",
+        snippet_url="https://snippet.kargo.com/snippet/dm/81298",
+        device_type=DeviceType.MOBILE,
+        viewability_config=ViewabilityConfig(
+            phase=ViewabilityPhase.PHASE_1,
+            vendors=(ViewabilityVendor.DOUBLE_VERIFY,),
+            method="platform_native"
+        )
     )
-)
-
-EXAMPLE_VIDEO_CONFIG = CreativeConfig(
-    name="PMP_Amazon_RMI_Pre-Roll_Branded_Canvas_15s",
-    format=CreativeFormat.ENHANCED_PREROLL,
-    dimensions="300x50",
-    snippet_url="https://snippet.kargo.com/snippet/dm/81172",
-    device_type=DeviceType.MOBILE,
-    duration=15,
-    branded_canvas=True,
-    viewability_config=ViewabilityConfig(
-        phase=ViewabilityPhase.PHASE_2,
-        vendors=[ViewabilityVendor.IAS, ViewabilityVendor.DOUBLE_VERIFY],
-        method="s2s_plus_wrapped",
-        ias_s2s_enabled=True,
-        dsp_seat_id="KARGO_DSP_SEAT_001",
-        pub_id="kargo_publisher_id"
+
+@cache
+def _example_video_config() -> CreativeConfig:
+    return CreativeConfig(
+        name="PMP_Amazon_RMI_Pre-Roll_Branded_Canvas_15s",
+        format=CreativeFormat.ENHANCED_PREROLL,
+        dimensions="300x50",
+        snippet_url="https://snippet.kargo.com/snippet/dm/81172",
+        device_type=DeviceType.MOBILE,
+        duration=15,
+        branded_canvas=True,
+        viewability_config=ViewabilityConfig(
+            phase=ViewabilityPhase.PHASE_2,
+            vendors=(ViewabilityVendor.IAS, ViewabilityVendor.DOUBLE_VERIFY),
+            method="s2s_plus_wrapped",
+            ias_s2s_enabled=True,
+            dsp_seat_id="KARGO_DSP_SEAT_001",
+            pub_id="kargo_publisher_id"
+        )
     )
-)
\ No newline at end of file
+
+
+_LAZY_EXAMPLES = {
+    "EXAMPLE_RUNWAY_CONFIG": _example_runway_config,
+    "EXAMPLE_VIDEO_CONFIG": _example_video_config,
+}
+
+
+if TYPE_CHECKING:
+    EXAMPLE_RUNWAY_CONFIG: CreativeConfig
+    EXAMPLE_VIDEO_CONFIG: CreativeConfig
+
+
+def __getattr__(name: str) -> CreativeConfig:
+    """Build example configs on first access instead of at import time."""
+    if name in _LAZY_EXAMPLES:
+        return _LAZY_EXAMPLES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
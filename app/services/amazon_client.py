@@ -330,21 +330,32 @@ class MockAmazonDSPClient:
         
         return mock_data
     
-    async def batch_upload_creatives(self, requests: List[AmazonCreativeUploadRequest]) -> List[AmazonCreativeUploadResponse]:
-        """Upload multiple creatives in batch."""
+    async def batch_upload_creatives(
+        self, requests: List[AmazonCreativeUploadRequest]
+    ) -> List[Optional[AmazonCreativeUploadResponse]]:
+        """Upload multiple creatives in batch.
+        
+        Returns one entry per request, in request order; failed uploads are
+        logged and returned as None.
+        """
         logger.info(f"Batch uploading {len(requests)} creatives")
         
-        results = []
-        for request in requests:
-            try:
-                response = await self.upload_creative(request)
-                results.append(response)
-            except Exception as e:
-                logger.error(f"Failed to upload creative {request.name}: {e}")
-                # Continue with other creatives
-                continue
-        
-        logger.info(f"Batch upload completed: {len(results)}/{len(requests)} successful")
+        # Upload concurrently; failures are collected rather than aborting the batch
+        outcomes = await asyncio.gather(
+            *(self.upload_creative(request) for request in requests),
+            return_exceptions=True,
+        )
+        
+        results: List[Optional[AmazonCreativeUploadResponse]] = []
+        for request, outcome in zip(requests, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to upload creative {request.name}: {outcome}")
+                results.append(None)
+            else:
+                results.append(outcome)
+        
+        successful = sum(result is not None for result in results)
+        logger.info(f"Batch upload completed: {successful}/{len(requests)} successful")
         return results
     
     def get_mock_data_summary(self) -> Dict[str, Any]:
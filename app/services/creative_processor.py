@@ -1,17 +1,23 @@
 """Core creative processing service for Kargo x Amazon DSP integration."""
+import asyncio
 import re
 import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from string import Template
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Select, and_, or_, select
 
 from app.models.creative import (
     CreativeConfig,
     ProcessedCreative,
     ProcessingMetadata,
     CreativeFormat,
+    DeviceType,
     ViewabilityPhase,
     ViewabilityVendor,
 )
@@ -38,6 +44,11 @@ class SnippetTransformer:
         r'fw\.adsafeprotected\.com[^"\s>]*',
     ]
     
+    # Compiled once; every IAS pattern above also requires this domain marker
+    IAS_REGEXES = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in IAS_PATTERNS)
+    IAS_DOMAIN_MARKER = "adsafeprotected"
+    BLANK_LINES_REGEX = re.compile(r'\n\s*\n')
+    
     DV_PATTERNS = [
         r'<img[^>]*doubleverify[^>]*>',
         r'<script[^>]*doubleverify[^>]*>.*?</script>',
@@ -58,20 +69,83 @@ class SnippetTransformer:
         '${GDPR_CONSENT}': '${AMAZON_GDPR_CONSENT}',
     }
     
+    # Display wrappers; $$ escapes the Amazon DSP macros left for the ad server
+    DISPLAY_PHASE1_TEMPLATE = Template("""
+        <div class="amazon-dsp-display-wrapper" data-phase="phase_1">
+            <script type="application/json" class="amazon-config">
+            ${config_json}
+            </script>
+            
+            <!-- Original Kargo Creative (IAS removed, DV preserved) -->
+            ${snippet_code}
+            
+            <script>
+                // Amazon DSP integration
+                window.amazonDSPConfig = {
+                    clickUrl: '$${AMAZON_CLICK_URL}',
+                    impressionUrl: '$${AMAZON_IMPRESSION_URL}',
+                    campaignId: '$${AMAZON_CAMPAIGN_ID}',
+                    creativeId: '$${AMAZON_CREATIVE_ID}',
+                    viewabilityMethod: 'platform_native'
+                };
+                
+                // DV viewability handled by Amazon DSP platform
+                // No additional viewability pixels needed
+                console.log('Amazon DSP Phase 1 creative loaded:', window.amazonDSPConfig);
+            </script>
+        </div>
+        """)
+    
+    DISPLAY_PHASE2_TEMPLATE = Template("""
+        <div class="amazon-dsp-display-wrapper" data-phase="phase_2">
+            <script type="application/json" class="amazon-config">
+            ${config_json}
+            </script>
+            
+            <!-- IAS S2S Configuration (no client-side tags needed) -->
+            <script type="application/json" class="ias-s2s-config">
+            ${ias_s2s_json}
+            </script>
+            
+            <!-- Original Kargo Creative (IAS removed, DV preserved) -->
+            ${snippet_code}
+            
+            <script>
+                // Amazon DSP integration with dual vendor support
+                window.amazonDSPConfig = {
+                    clickUrl: '$${AMAZON_CLICK_URL}',
+                    impressionUrl: '$${AMAZON_IMPRESSION_URL}',
+                    campaignId: '$${AMAZON_CAMPAIGN_ID}',
+                    creativeId: '$${AMAZON_CREATIVE_ID}',
+                    viewabilityMethod: 's2s_plus_native',
+                    vendors: {
+                        ias: 'server_side',
+                        dv: 'platform_native'
+                    }
+                };
+                
+                console.log('Amazon DSP Phase 2 creative loaded:', window.amazonDSPConfig);
+            </script>
+        </div>
+        """)
+    
     @classmethod
     def remove_ias_tags(cls, snippet_code: str) -> Tuple[str, List[str]]:
         """Remove IAS tracking tags from snippet code."""
         removed_tags = []
         cleaned_code = snippet_code
         
-        for pattern in cls.IAS_PATTERNS:
-            matches = re.findall(pattern, cleaned_code, re.IGNORECASE | re.DOTALL)
-            if matches:
-                removed_tags.extend(matches)
-                cleaned_code = re.sub(pattern, '', cleaned_code, flags=re.IGNORECASE | re.DOTALL)
+        def remove_match(match: re.Match) -> str:
+            removed_tags.append(match.group(0))
+            return ''
+        
+        # Skip the pattern scans entirely for snippets without IAS domains
+        if cls.IAS_DOMAIN_MARKER in snippet_code.lower():
+            for regex in cls.IAS_REGEXES:
+                cleaned_code = regex.sub(remove_match, cleaned_code)
         
         # Clean up extra whitespace
-        cleaned_code = re.sub(r'\n\s*\n', '\n', cleaned_code)
+        cleaned_code = cls.BLANK_LINES_REGEX.sub('\n', cleaned_code)
         
         return cleaned_code.strip(), removed_tags
     
@@ -103,104 +177,120 @@ class SnippetTransformer:
         return processed_code
     
     @classmethod
-    def wrap_display_html5_phase1(cls, snippet_code: str, config: CreativeConfig) -> str:
-        """Wrap HTML5 display creative for Phase 1 (DV-only)."""
-        wrapped_code = f"""
-        <div class="amazon-dsp-display-wrapper" data-phase="phase_1">
-            <script type="application/json" class="amazon-config">
-            {{
+    @lru_cache(maxsize=512)
+    def _display_config_json(
+        cls,
+        phase: ViewabilityPhase,
+        name: str,
+        dimensions: str,
+        device_type: DeviceType,
+        dsp_seat_id: Optional[str] = None,
+        pub_id: Optional[str] = None,
+    ) -> str:
+        """Serialize the display wrapper's amazon-config blob once per config."""
+        config_blob: Dict[str, Any]
+        if phase == ViewabilityPhase.PHASE_1:
+            config_blob = {
                 "format": "display_html5",
-                "creative_name": "{config.name}",
-                "dimensions": "{config.dimensions}",
-                "device_type": "{config.device_type}",
+                "creative_name": name,
+                "dimensions": dimensions,
+                "device_type": device_type,
                 "viewability_vendor": "double_verify",
                 "viewability_method": "platform_native",
-                "phase": "phase_1"
-            }}
-            </script>
-            
-            <!-- Original Kargo Creative (IAS removed, DV preserved) -->
-            {snippet_code}
-            
-            <script>
-                // Amazon DSP integration
-                window.amazonDSPConfig = {{
-                    clickUrl: '${{AMAZON_CLICK_URL}}',
-                    impressionUrl: '${{AMAZON_IMPRESSION_URL}}',
-                    campaignId: '${{AMAZON_CAMPAIGN_ID}}',
-                    creativeId: '${{AMAZON_CREATIVE_ID}}',
-                    viewabilityMethod: 'platform_native'
-                }};
-                
-                // DV viewability handled by Amazon DSP platform
-                // No additional viewability pixels needed
-                console.log('Amazon DSP Phase 1 creative loaded:', window.amazonDSPConfig);
-            </script>
-        </div>
-        """
+                "phase": "phase_1",
+            }
+        else:
+            config_blob = {
+                "format": "display_html5",
+                "creative_name": name,
+                "dimensions": dimensions,
+                "device_type": device_type,
+                "viewability_vendors": ["ias", "double_verify"],
+                "viewability_method": "s2s_plus_native",
+                "phase": "phase_2",
+                "ias_s2s_enabled": True,
+                "dsp_seat_id": dsp_seat_id,
+                "pub_id": pub_id,
+            }
+        return orjson.dumps(config_blob).decode()
+    
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _ias_s2s_config_json(cls, dsp_seat_id: Optional[str], pub_id: Optional[str]) -> str:
+        """Serialize the Phase 2 ias-s2s-config blob once per seat and publisher."""
+        return orjson.dumps({
+            "seat_id": dsp_seat_id,
+            "publisher_id": pub_id,
+            "campaign_id": "${AMAZON_CAMPAIGN_ID}",
+            "creative_id": "${AMAZON_CREATIVE_ID}",
+            "measurement_method": "server_to_server",
+        }).decode()
+    
+    @classmethod
+    def wrap_display_html5_phase1(cls, snippet_code: str, config: CreativeConfig) -> str:
+        """Wrap HTML5 display creative for Phase 1 (DV-only)."""
+        wrapped_code = cls.DISPLAY_PHASE1_TEMPLATE.substitute(
+            config_json=cls._display_config_json(
+                ViewabilityPhase.PHASE_1, config.name, config.dimensions, config.device_type
+            ),
+            snippet_code=snippet_code,
+        )
         
         return wrapped_code.strip()
     
     @classmethod
     def wrap_display_html5_phase2(cls, snippet_code: str, config: CreativeConfig) -> str:
         """Wrap HTML5 display creative for Phase 2 (IAS S2S + DV)."""
-        wrapped_code = f"""
-        <div class="amazon-dsp-display-wrapper" data-phase="phase_2">
-            <script type="application/json" class="amazon-config">
-            {{
-                "format": "display_html5",
-                "creative_name": "{config.name}",
-                "dimensions": "{config.dimensions}",
-                "device_type": "{config.device_type}",
-                "viewability_vendors": ["ias", "double_verify"],
-                "viewability_method": "s2s_plus_native",
-                "phase": "phase_2",
-                "ias_s2s_enabled": true,
-                "dsp_seat_id": "{config.viewability_config.dsp_seat_id}",
-                "pub_id": "{config.viewability_config.pub_id}"
-            }}
-            </script>
-            
-            <!-- IAS S2S Configuration (no client-side tags needed) -->
-            <script type="application/json" class="ias-s2s-config">
-            {{
-                "seat_id": "{config.viewability_config.dsp_seat_id}",
-                "publisher_id": "{config.viewability_config.pub_id}",
-                "campaign_id": "${{AMAZON_CAMPAIGN_ID}}",
-                "creative_id": "${{AMAZON_CREATIVE_ID}}",
-                "measurement_method": "server_to_server"
-            }}
-            </script>
-            
-            <!-- Original Kargo Creative (IAS removed, DV preserved) -->
-            {snippet_code}
-            
-            <script>
-                // Amazon DSP integration with dual vendor support
-                window.amazonDSPConfig = {{
-                    clickUrl: '${{AMAZON_CLICK_URL}}',
-                    impressionUrl: '${{AMAZON_IMPRESSION_URL}}',
-                    campaignId: '${{AMAZON_CAMPAIGN_ID}}',
-                    creativeId: '${{AMAZON_CREATIVE_ID}}',
-                    viewabilityMethod: 's2s_plus_native',
-                    vendors: {{
-                        ias: 'server_side',
-                        dv: 'platform_native'
-                    }}
-                }};
-                
-                console.log('Amazon DSP Phase 2 creative loaded:', window.amazonDSPConfig);
-            </script>
-        </div>
-        """
+        dsp_seat_id = config.viewability_config.dsp_seat_id
+        pub_id = config.viewability_config.pub_id
+        wrapped_code = cls.DISPLAY_PHASE2_TEMPLATE.substitute(
+            config_json=cls._display_config_json(
+                ViewabilityPhase.PHASE_2,
+                config.name,
+                config.dimensions,
+                config.device_type,
+                dsp_seat_id,
+                pub_id,
+            ),
+            ias_s2s_json=cls._ias_s2s_config_json(dsp_seat_id, pub_id),
+            snippet_code=snippet_code,
+        )
         
         return wrapped_code.strip()
     
+    @staticmethod
+    def _vast_config_key(config: CreativeConfig) -> Tuple[Any, ...]:
+        """Project the config fields the VAST wrappers read into a hashable key."""
+        return (
+            config.name,
+            config.snippet_url,
+            config.duration,
+            config.branded_canvas,
+            config.dimensions,
+            config.viewability_config.dsp_seat_id,
+            config.viewability_config.pub_id,
+        )
+    
     @classmethod
     def wrap_vast_phase1(cls, snippet_code: str, config: CreativeConfig) -> str:
         """Wrap VAST creative for Phase 1 (DV-only)."""
+        return cls._render_vast_phase1(*cls._vast_config_key(config))
+    
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _render_vast_phase1(
+        cls,
+        name: str,
+        snippet_url: str,
+        duration: Optional[int],
+        branded_canvas: bool,
+        dimensions: str,
+        dsp_seat_id: Optional[str],
+        pub_id: Optional[str],
+    ) -> str:
+        """Render the Phase 1 VAST wrapper, memoized on the config fields it reads."""
         # Generate unique IDs for VAST elements
-        ad_id = f"{config.name}_phase1"
+        ad_id = f"{name}_phase1"
         
         vast_wrapper = f"""<?xml version="1.0" encoding="UTF-8"?>
         <VAST version="3.0">
@@ -208,7 +298,7 @@ class SnippetTransformer:
                 <Wrapper>
                     <AdSystem>Kargo Amazon DSP Phase 1</AdSystem>
                     <VASTAdTagURI>
-                        <![CDATA[{config.snippet_url}?cb=${{AMAZON_CACHEBUSTER}}]]>
+                        <![CDATA[{snippet_url}?cb=${{AMAZON_CACHEBUSTER}}]]>
                     </VASTAdTagURI>
                     
                     <!-- Amazon DSP Impression Tracking -->
@@ -224,7 +314,7 @@ class SnippetTransformer:
                     <Creatives>
                         <Creative>
                             <Linear>
-                                <Duration>00:00:{config.duration:02d}</Duration>
+                                <Duration>00:00:{duration:02d}</Duration>
                                 
                                 <!-- DV Video Tracking Events -->
                                 <TrackingEvents>
@@ -254,8 +344,8 @@ class SnippetTransformer:
                             
                             <!-- Branded Canvas Companion (if enabled) -->"""
         
-        if config.branded_canvas:
-            canvas_width, canvas_height = config.dimensions.split('x')
+        if branded_canvas:
+            canvas_width, canvas_height = dimensions.split('x')
             vast_wrapper += f"""
                             <CompanionAds>
                                 <Companion width="{canvas_width}" height="{canvas_height}">
@@ -290,14 +380,29 @@ class SnippetTransformer:
                     </Extensions>
                 </Wrapper>
             </Ad>
-        </VAST>""".format(config.name)
+        </VAST>""".format(name)
         
         return vast_wrapper.strip()
     
     @classmethod
     def wrap_vast_phase2(cls, snippet_code: str, config: CreativeConfig) -> str:
         """Wrap VAST creative for Phase 2 (IAS S2S + DV)."""
-        ad_id = f"{config.name}_phase2"
+        return cls._render_vast_phase2(*cls._vast_config_key(config))
+    
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _render_vast_phase2(
+        cls,
+        name: str,
+        snippet_url: str,
+        duration: Optional[int],
+        branded_canvas: bool,
+        dimensions: str,
+        dsp_seat_id: Optional[str],
+        pub_id: Optional[str],
+    ) -> str:
+        """Render the Phase 2 VAST wrapper, memoized on the config fields it reads."""
+        ad_id = f"{name}_phase2"
         
         vast_wrapper = f"""<?xml version="1.0" encoding="UTF-8"?>
         <VAST version="3.0">
@@ -305,7 +410,7 @@ class SnippetTransformer:
                 <Wrapper>
                     <AdSystem>Kargo Amazon DSP Phase 2</AdSystem>
                     <VASTAdTagURI>
-                        <![CDATA[{config.snippet_url}?cb=${{AMAZON_CACHEBUSTER}}]]>
+                        <![CDATA[{snippet_url}?cb=${{AMAZON_CACHEBUSTER}}]]>
                     </VASTAdTagURI>
                     
                     <!-- Amazon DSP Impression Tracking -->
@@ -321,7 +426,7 @@ class SnippetTransformer:
                     <Creatives>
                         <Creative>
                             <Linear>
-                                <Duration>00:00:{config.duration:02d}</Duration>
+                                <Duration>00:00:{duration:02d}</Duration>
                                 
                                 <!-- DV Video Tracking Events -->
                                 <TrackingEvents>
@@ -351,8 +456,8 @@ class SnippetTransformer:
                             
                             <!-- Branded Canvas Companion (if enabled) -->"""
         
-        if config.branded_canvas:
-            canvas_width, canvas_height = config.dimensions.split('x')
+        if branded_canvas:
+            canvas_width, canvas_height = dimensions.split('x')
             vast_wrapper += f"""
                             <CompanionAds>
                                 <Companion width="{canvas_width}" height="{canvas_height}">
@@ -380,8 +485,8 @@ class SnippetTransformer:
                         <!-- IAS S2S Configuration -->
                         <Extension type="IAS_S2S">
                             <IASData>
-                                <SeatId>{config.viewability_config.dsp_seat_id}</SeatId>
-                                <PublisherId>{config.viewability_config.pub_id}</PublisherId>
+                                <SeatId>{dsp_seat_id}</SeatId>
+                                <PublisherId>{pub_id}</PublisherId>
                                 <MeasurementType>server_to_server</MeasurementType>
                                 <CampaignId>${{AMAZON_CAMPAIGN_ID}}</CampaignId>
                                 <CreativeId>${{AMAZON_CREATIVE_ID}}</CreativeId>
@@ -392,7 +497,7 @@ class SnippetTransformer:
                             <AmazonData>
                                 <Phase>phase_2</Phase>
                                 <ViewabilityMethod>ias_s2s_plus_dv_wrapped</ViewabilityMethod>
-                                <CreativeName>{config.name}</CreativeName>
+                                <CreativeName>{name}</CreativeName>
                                 <DualVendorEnabled>true</DualVendorEnabled>
                             </AmazonData>
                         </Extension>
@@ -414,10 +519,55 @@ class CreativeProcessor:
     
     async def process_creative(self, config: CreativeConfig) -> ProcessedCreative:
         """Process a creative configuration into Amazon DSP ready format."""
-        logger.info(f"Processing creative: {config.name}")
+        start_time = time.time()
+        
+        processed_creative = await self._build_processed_creative(config)
+        
+        # Store in database
+        await self._store_processed_creative(processed_creative, config)
         
+        self._record_processing_success(processed_creative, config, start_time)
+        
+        return processed_creative
+    
+    async def process_creatives(
+        self, configs: List[CreativeConfig]
+    ) -> List[Union[ProcessedCreative, Exception]]:
+        """
+        Process several creative configurations concurrently.
+        
+        Snippet fetches and transformations run together; the results are
+        stored one at a time since they share this processor's session, each
+        in its own savepoint so a failed insert rolls back only that item.
+        Returns one entry per config, in order: the processed creative, or
+        the exception that stopped it.
+        """
         start_time = time.time()
         
+        outcomes: List[Union[ProcessedCreative, Exception]] = list(
+            await asyncio.gather(
+                *(self._build_processed_creative(config) for config in configs),
+                return_exceptions=True,
+            )
+        )
+        
+        for index, (config, outcome) in enumerate(zip(configs, outcomes, strict=True)):
+            if isinstance(outcome, Exception):
+                continue
+            try:
+                async with self.db_session.begin_nested():
+                    await self._store_processed_creative(outcome, config)
+            except Exception as e:
+                outcomes[index] = e
+                continue
+            self._record_processing_success(outcome, config, start_time)
+        
+        return outcomes
+    
+    async def _build_processed_creative(self, config: CreativeConfig) -> ProcessedCreative:
+        """Validate, fetch and transform a creative without persisting it."""
+        logger.info(f"Processing creative: {config.name}")
+        
         # Validate configuration
         await self._validate_config(config)
         
@@ -448,9 +598,12 @@ class CreativeProcessor:
             processing_metadata=processing_metadata,
         )
         
-        # Store in database
-        await self._store_processed_creative(processed_creative, config)
-        
+        return processed_creative
+    
+    def _record_processing_success(
+        self, processed_creative: ProcessedCreative, config: CreativeConfig, start_time: float
+    ) -> None:
+        """Record metrics and log a successfully processed creative."""
         processing_time = (time.time() - start_time) * 1000
         
         # Record metrics
@@ -461,9 +614,9 @@ class CreativeProcessor:
             status="success"
         )
         
-        logger.info(f"Creative processed successfully: {creative_id} ({processing_time:.1f}ms)")
-        
-        return processed_creative
+        logger.info(
+            f"Creative processed successfully: {processed_creative.creative_id} ({processing_time:.1f}ms)"
+        )
     
     async def _validate_config(self, config: CreativeConfig) -> None:
         """Validate creative configuration."""
@@ -575,9 +728,9 @@ class CreativeProcessor:
             processed_code=creative.processed_code,
             amazon_dsp_ready=creative.amazon_dsp_ready,
             creative_type=creative.creative_type,
-            viewability_config=creative.viewability_config.dict(),
-            processing_metadata=creative.processing_metadata.dict(),
-            original_config=config.dict(),
+            viewability_config=creative.viewability_config.model_dump(mode="json"),
+            processing_metadata=creative.processing_metadata.model_dump(mode="json"),
+            original_config=config.model_dump(mode="json"),
         )
         
         self.db_session.add(db_creative)
@@ -607,14 +760,61 @@ class CreativeProcessor:
             updated_at=db_creative.updated_at,
         )
     
-    async def list_processed_creatives(self, skip: int = 0, limit: int = 100) -> List[ProcessedCreative]:
-        """List processed creatives with pagination."""
-        result = await self.db_session.execute(
-            select(ProcessedCreativeDB)
-            .offset(skip)
+    async def _creative_page_query(
+        self, selected: List[Any], skip: int, limit: int, after: Optional[str]
+    ) -> Select[Any]:
+        """Select ``selected`` for one page of creatives, newest first.
+        
+        Raises ValueError if ``after`` is not an existing creative_id, or if
+        it is combined with a non-zero ``skip``.
+        """
+        query = (
+            select(*selected)
+            .order_by(ProcessedCreativeDB.created_at.desc(), ProcessedCreativeDB.creative_id.desc())
             .limit(limit)
-            .order_by(ProcessedCreativeDB.created_at.desc())
         )
+        
+        if after is None:
+            return query.offset(skip)
+        if skip:
+            raise ValueError("Use either skip or after for pagination, not both")
+        
+        cursor_created_at = await self.db_session.scalar(
+            select(ProcessedCreativeDB.created_at)
+            .where(ProcessedCreativeDB.creative_id == after)
+        )
+        if cursor_created_at is None:
+            raise ValueError(f"Unknown creative cursor: {after}")
+        return query.where(
+            or_(
+                ProcessedCreativeDB.created_at < cursor_created_at,
+                and_(
+                    ProcessedCreativeDB.created_at == cursor_created_at,
+                    ProcessedCreativeDB.creative_id < after,
+                ),
+            )
+        )
+    
+    async def list_processed_creatives(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[str] = None,
+    ) -> List[ProcessedCreative]:
+        """
+        List processed creatives, newest first.
+        
+        Pass the last creative_id of the previous page as ``after`` for keyset
+        pagination, which seeks past the cursor instead of scanning ``skip``
+        rows. ``skip`` is kept for existing offset-based callers. For deep
+        offset pages, a deferred join (paginate over the ids, then join back
+        for the wide columns) is the equivalent fallback.
+        
+        Raises ValueError if ``after`` does not name an existing creative or
+        is combined with a non-zero ``skip``.
+        """
+        query = await self._creative_page_query([ProcessedCreativeDB], skip, limit, after)
+        result = await self.db_session.execute(query)
         db_creatives = result.scalars().all()
         
         return [
@@ -634,6 +834,30 @@ class CreativeProcessor:
             for db_creative in db_creatives
         ]
     
+    async def list_processed_creative_rows(
+        self,
+        columns: Tuple[str, ...],
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List only the given columns of processed creatives, as plain dicts.
+        
+        Same ordering and pagination as ``list_processed_creatives``, but
+        selects just ``columns`` (e.g. ``("creative_id", "name")``), skipping
+        the wide code and JSON columns and ORM hydration.
+        """
+        unknown = [name for name in columns if name not in ProcessedCreativeDB.__table__.c]
+        if unknown:
+            raise ValueError(f"Unknown creative columns: {', '.join(unknown)}")
+        selected = [ProcessedCreativeDB.__table__.c[name] for name in columns]
+        
+        result = await self.db_session.execute(
+            await self._creative_page_query(selected, skip, limit, after)
+        )
+        return [dict(row._mapping) for row in result]
+    
     async def delete_processed_creative(self, creative_id: str) -> bool:
         """Delete processed creative."""
         result = await self.db_session.execute(
@@ -672,7 +896,7 @@ class CreativeProcessor:
             width=width,
             height=height,
             advertiser_id=advertiser_id,
-            viewability_config=creative.viewability_config.dict(),
+            viewability_config=creative.viewability_config.model_dump(mode="json"),
         )
         
         # Upload to Amazon DSP
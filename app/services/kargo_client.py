@@ -1,9 +1,12 @@
 """Kargo snippet API client with mock and real implementations."""
 import asyncio
 import logging
+import re
 import time
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 from datetime import datetime
+from functools import cache
 from urllib.parse import urljoin, urlparse
 
 import httpx
@@ -16,6 +19,9 @@ from app.utils.metrics import MetricsCollector
 
 logger = get_logger("kargo.client")
 
+# Matches the ID in snippet paths like /snippet/dm/81298
+_SNIPPET_ID_RE = re.compile(r"^/*snippet/dm/([^/]+)")
+
 
 class KargoSnippetResponse(BaseModel):
     """Response model for Kargo snippet retrieval."""
@@ -34,23 +40,35 @@ class KargoSnippetResponse(BaseModel):
 class MockKargoClient:
     """Mock Kargo API client for development and testing."""
     
-    def __init__(self, base_url: str = "https://snippet.kargo.com", api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str = "https://snippet.kargo.com",
+        api_key: Optional[str] = None,
+        latency: float = 0.1,
+    ):
         self.base_url = base_url
         self.api_key = api_key
-        self.session = httpx.AsyncClient(timeout=30.0)
+        self.latency = latency  # Simulated API latency in seconds
         
-        # Mock snippet database
+        # Mock snippet database, shared read-only by every instance
         self._mock_snippets = self._generate_mock_snippets()
     
     async def __aenter__(self):
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.session.aclose()
+        # Snippets are served from memory, so there is no HTTP session to close
+        return None
     
-    def _generate_mock_snippets(self) -> Dict[str, Dict[str, Any]]:
-        """Generate realistic mock snippet data."""
-        snippets = {}
+    @staticmethod
+    @cache
+    def _generate_mock_snippets() -> Mapping[str, Mapping[str, Any]]:
+        """Generate realistic mock snippet data, once per process.
+        
+        The table is shared by every client, so it is returned read-only all
+        the way down to each snippet's metadata.
+        """
+        snippets: Dict[str, Dict[str, Any]] = {}
         
         # Runway Display Creatives
         runway_snippet = """
@@ -261,7 +279,10 @@ class MockKargoClient:
             "metadata": {"type": "test"}
         }
         
-        return snippets
+        return MappingProxyType({
+            snippet_id: MappingProxyType({**data, "metadata": MappingProxyType(data["metadata"])})
+            for snippet_id, data in snippets.items()
+        })
     
     @kargo_api_retry_async
     async def get_snippet(self, snippet_url: str) -> KargoSnippetResponse:
@@ -269,7 +290,7 @@ class MockKargoClient:
         logger.info(f"Fetching snippet: {snippet_url}")
         
         # Simulate API latency
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(self.latency)
         
         # Extract snippet ID from URL
         snippet_id = self._extract_snippet_id(snippet_url)
@@ -277,14 +298,14 @@ class MockKargoClient:
         if snippet_id not in self._mock_snippets:
             raise RetryableHTTPError(404, f"Snippet not found: {snippet_id}")
         
-        snippet_data = self._mock_snippets[snippet_id].copy()
-        snippet_data["snippet_url"] = snippet_url
+        # Validation copies the read-only metadata into a dict owned by the response
+        snippet_data = {**self._mock_snippets[snippet_id], "snippet_url": snippet_url}
         
         # Record metrics
         MetricsCollector.record_kargo_request(
             endpoint="get_snippet",
             status_code=200,
-            duration=0.1
+            duration=self.latency
         )
         
         logger.info(f"Snippet retrieved successfully: {snippet_id}")
@@ -294,21 +315,20 @@ class MockKargoClient:
     def _extract_snippet_id(self, snippet_url: str) -> str:
         """Extract snippet ID from Kargo URL."""
         # Parse URL like https://snippet.kargo.com/snippet/dm/81298
-        parsed = urlparse(snippet_url)
-        path_parts = parsed.path.strip('/').split('/')
-        
-        if len(path_parts) >= 3 and path_parts[0] == 'snippet' and path_parts[1] == 'dm':
-            return path_parts[2]
+        path = urlparse(snippet_url).path
+        match = _SNIPPET_ID_RE.match(path)
+        if match:
+            return match.group(1)
         
         # Fallback for other URL patterns
-        return path_parts[-1] if path_parts else "unknown"
+        return path.strip('/').rsplit('/', 1)[-1]
     
     @kargo_api_retry_async
     async def get_snippet_metadata(self, snippet_id: str) -> Dict[str, Any]:
         """Get metadata for a snippet."""
         logger.info(f"Fetching snippet metadata: {snippet_id}")
         
-        await asyncio.sleep(0.05)  # Simulate API latency
+        await asyncio.sleep(self.latency / 2)  # Simulate API latency
         
         if snippet_id not in self._mock_snippets:
             raise RetryableHTTPError(404, f"Snippet not found: {snippet_id}")
@@ -330,7 +350,7 @@ class MockKargoClient:
         MetricsCollector.record_kargo_request(
             endpoint="get_snippet_metadata",
             status_code=200,
-            duration=0.05
+            duration=self.latency / 2
         )
         
         return metadata
@@ -434,11 +454,17 @@ async def create_kargo_client(
         base_url: Kargo API base URL
         api_key: API key for authentication
         use_mock: Whether to use mock client (True for development)
+    
+    A ``base_url`` of None keeps the client's default URL.
     """
+    settings: Dict[str, Any] = {"api_key": api_key}
+    if base_url is not None:
+        settings["base_url"] = base_url
+    
     if use_mock:
-        return MockKargoClient(base_url=base_url, api_key=api_key)
+        return MockKargoClient(**settings)
     else:
-        return RealKargoClient(base_url=base_url, api_key=api_key)
+        return RealKargoClient(**settings)
 
 
 # Global client instance for dependency injection
@@ -1,12 +1,25 @@
 """Test configuration and fixtures for Kargo x Amazon DSP Integration."""
 import asyncio
-from typing import AsyncGenerator, Generator
+import os
+import warnings
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, AsyncGenerator, Dict, Iterator
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.dialects import sqlite as sqlite_dialect
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 from fastapi.testclient import TestClient
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+    uvloop = None
 
 from app.main import app
 from app.models.database import Base, get_db_session
@@ -19,101 +32,208 @@ from app.models.creative import (
     DeviceType
 )
 from app.models.campaign import CampaignConfig, CampaignPhase, GoalKPI
+from app.services import kargo_client as kargo_client_module
+from app.services.kargo_client import MockKargoClient
+from app.tests.helpers import PHASE1_DV_VIEWABILITY
+
+
+# Test database URL (shared-cache in-memory SQLite, visible to every connection).
+# Each pytest-xdist worker gets its own named database so workers never collide.
+TEST_DATABASE_URL = "sqlite+aiosqlite:///file:testdb_{worker_id}?mode=memory&cache=shared&uri=true"
+
+# The whole schema compiled once at import and replayed with one executescript.
+TEST_SCHEMA_DDL = ";\n".join(
+    str(ddl.compile(dialect=sqlite_dialect.dialect())).strip()
+    for table in Base.metadata.sorted_tables
+    for ddl in (
+        CreateTable(table),
+        *(CreateIndex(index) for index in sorted(table.indexes, key=lambda i: i.name)),
+    )
+) + ";"
 
 
-# Test database URL (in-memory SQLite)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """Apply test-friendly PRAGMAs to each new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the async suite on uvloop where it is available."""
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
-@pytest_asyncio.fixture
-async def test_engine():
-    """Create test database engine."""
+def pytest_collection_modifyitems(items) -> None:
+    """Run every async test in the session-scoped event loop."""
+    session_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_marker, append=False)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_engine(request):
+    """Create test database engine.
+    
+    Uses ``StaticPool`` by default and ``NullPool`` under pytest-xdist, where
+    holding a pinned connection only adds contention. Either pool class can be
+    requested explicitly through indirect parametrization.
+    """
+    default_pool = NullPool if os.environ.get("PYTEST_XDIST_WORKER") else StaticPool
+    poolclass = getattr(request, "param", default_pool)
+    worker_id = getattr(request.config, "workerinput", {}).get("workerid", "master")
     engine = create_async_engine(
-        TEST_DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+        TEST_DATABASE_URL.format(worker_id=worker_id),
+        connect_args={"check_same_thread": False, "uri": True},
+        poolclass=poolclass,
         echo=False,
     )
+    event.listen(engine.sync_engine, "connect", _configure_sqlite_connection)
     
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # A shared-cache in-memory database is dropped once its last connection
+    # closes; NullPool closes on every checkin, so keep one connection open.
+    # Closing it on teardown discards the schema, so no drop_all is needed.
+    keeper = await engine.connect()
+    raw_connection = await keeper.get_raw_connection()
+    await raw_connection.driver_connection.executescript(TEST_SCHEMA_DDL)
     
     yield engine
     
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    
+    await keeper.close()
     await engine.dispose()
 
 
-@pytest_asyncio.fixture
-async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session."""
-    async_session = async_sessionmaker(
+@pytest_asyncio.fixture(scope="session")
+async def test_sessionmaker(test_engine) -> async_sessionmaker[AsyncSession]:
+    """Create the session factory shared by every test."""
+    return async_sessionmaker(
         test_engine, class_=AsyncSession, expire_on_commit=False
     )
-    
-    async with async_session() as session:
-        yield session
 
 
-@pytest.fixture
-def test_client(test_session):
-    """Create test client with dependency override."""
-    async def override_get_db():
-        yield test_session
-    
-    app.dependency_overrides[get_db_session] = override_get_db
+@pytest_asyncio.fixture
+async def _reset_state(test_engine) -> AsyncGenerator[None, None]:
+    """Wipe every table after the test.
     
-    with TestClient(app) as client:
-        yield client
+    The engine and HTTP clients live for the whole session, so rows written by
+    one test would otherwise be visible to the next. Only tests that write to
+    the database pay for this: ``test_session`` depends on it, and modules that
+    write through the session-scoped clients override it.
+    """
+    yield
     
-    app.dependency_overrides.clear()
+    async with test_engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
 
 
 @pytest_asyncio.fixture
-async def async_client(test_session) -> AsyncGenerator[AsyncClient, None]:
-    """Create async test client."""
+async def test_session(
+    test_sessionmaker: async_sessionmaker[AsyncSession], _reset_state: None
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create test database session."""
+    async with test_sessionmaker() as session:
+        yield session
+
+
+@contextmanager
+def override_db(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> Iterator[None]:
+    """Serve the app's database dependency from ``session_factory`` for the block.
+    
+    Only the ``get_db_session`` override is touched, so overrides installed by
+    other fixtures survive.
+    """
     async def override_get_db():
-        yield test_session
+        async with session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
     
+    previous = app.dependency_overrides.get(get_db_session)
     app.dependency_overrides[get_db_session] = override_get_db
+    try:
+        yield
+    finally:
+        if previous is None:
+            app.dependency_overrides.pop(get_db_session, None)
+        else:
+            app.dependency_overrides[get_db_session] = previous
+
+
+@pytest.fixture(scope="session")
+def test_client(test_sessionmaker):
+    """Create test client with dependency override.
     
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    Deprecated: ``TestClient`` bridges every request through a worker thread;
+    use the ``async_client`` fixture instead.
+    """
+    warnings.warn(
+        "The test_client fixture is deprecated; use async_client instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    with override_db(test_sessionmaker), TestClient(app) as client:
         yield client
-    
-    app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(test_sessionmaker) -> AsyncGenerator[AsyncClient, None]:
+    """Create async test client backed by an in-process ASGI transport."""
+    with override_db(test_sessionmaker):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://testserver"
+        ) as client:
+            yield client
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def mock_kargo_client() -> AsyncGenerator[MockKargoClient, None]:
+    """Serve snippets to the app from a mock Kargo client with no simulated latency."""
+    previous = kargo_client_module._kargo_client
+    client = MockKargoClient(latency=0)
+    kargo_client_module._kargo_client = client
+    try:
+        yield client
+    finally:
+        kargo_client_module._kargo_client = previous
 
 
 # Test data fixtures
-@pytest.fixture
-def sample_runway_config() -> CreativeConfig:
-    """Sample Runway creative configuration."""
+# Pydantic templates are validated once per session; each test receives a deep
+# copy so in-place mutations never leak between tests.
+
+# Fixed campaign dates keep the templates deterministic across day boundaries.
+_FIXED_TODAY = date(2024, 1, 1)
+_START = _FIXED_TODAY + timedelta(days=1)
+_END = _FIXED_TODAY + timedelta(days=31)
+
+@pytest.fixture(scope="session")
+def _runway_template() -> CreativeConfig:
+    """Session-wide Runway creative configuration template."""
     return CreativeConfig(
         name="Test_Runway_Creative",
         format=CreativeFormat.RUNWAY,
         dimensions="320x50",
         snippet_url="https://snippet.kargo.com/snippet/dm/12345",
         device_type=DeviceType.MOBILE,
-        viewability_config=ViewabilityConfig(
-            phase=ViewabilityPhase.PHASE_1,
-            vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-            method="platform_native"
-        )
+        viewability_config=PHASE1_DV_VIEWABILITY
     )
 
 
-@pytest.fixture
-def sample_video_config() -> CreativeConfig:
-    """Sample video creative configuration."""
+@pytest.fixture(scope="session")
+def _video_template() -> CreativeConfig:
+    """Session-wide video creative configuration template."""
     return CreativeConfig(
         name="Test_Video_Creative",
         format=CreativeFormat.ENHANCED_PREROLL,
@@ -133,33 +253,95 @@ def sample_video_config() -> CreativeConfig:
     )
 
 
-@pytest.fixture
-def sample_campaign_config(sample_runway_config, sample_video_config) -> CampaignConfig:
-    """Sample campaign configuration."""
-    from datetime import date, timedelta
-    
+@pytest.fixture(scope="session")
+def _campaign_template(_runway_template, _video_template) -> CampaignConfig:
+    """Session-wide campaign configuration template."""
     return CampaignConfig(
         name="Test_Campaign",
         advertiser_id="123456",
         goal_kpi=GoalKPI.VIEWABILITY,
         total_budget=10000.0,
-        start_date=date.today() + timedelta(days=1),
-        end_date=date.today() + timedelta(days=31),
+        start_date=_START,
+        end_date=_END,
         phase=CampaignPhase.PHASE_1,
-        viewability_config=ViewabilityConfig(
-            phase=ViewabilityPhase.PHASE_1,
-            vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-            method="platform_native"
-        ),
-        runway_creatives=[sample_runway_config],
-        video_creatives=[sample_video_config]
+        viewability_config=PHASE1_DV_VIEWABILITY,
+        runway_creatives=[_runway_template],
+        video_creatives=[_video_template]
     )
 
 
+@pytest.fixture(scope="session")
+def config_catalog() -> Dict[str, CreativeConfig]:
+    """Frozen wrapper-test configs, validated once and shared by reference."""
+    phase2_viewability = {
+        "phase": ViewabilityPhase.PHASE_2,
+        "vendors": [ViewabilityVendor.IAS, ViewabilityVendor.DOUBLE_VERIFY],
+        "ias_s2s_enabled": True,
+        "dsp_seat_id": "KARGO_DSP_SEAT_001",
+        "pub_id": "kargo_test_pub",
+    }
+    display = {
+        "format": CreativeFormat.RUNWAY,
+        "dimensions": "320x50",
+        "snippet_url": "https://snippet.kargo.com/snippet/dm/12345",
+        "device_type": DeviceType.MOBILE,
+    }
+    vast = {
+        "format": CreativeFormat.ENHANCED_PREROLL,
+        "dimensions": "300x50",
+        "snippet_url": "https://snippet.kargo.com/snippet/dm/67890",
+        "device_type": DeviceType.MOBILE,
+        "duration": 15,
+    }
+    return {
+        "display_phase1": CreativeConfig(
+            name="Test Runway",
+            viewability_config=PHASE1_DV_VIEWABILITY,
+            **display,
+        ),
+        "display_phase2": CreativeConfig(
+            name="Test Runway Phase 2",
+            viewability_config=ViewabilityConfig(method="s2s_plus_native", **phase2_viewability),
+            **display,
+        ),
+        "vast_phase1": CreativeConfig(
+            name="Test Video",
+            branded_canvas=True,
+            viewability_config=ViewabilityConfig(
+                phase=ViewabilityPhase.PHASE_1,
+                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
+                method="vast_wrapped"
+            ),
+            **vast,
+        ),
+        "vast_phase2": CreativeConfig(
+            name="Test Video Phase 2",
+            branded_canvas=False,
+            viewability_config=ViewabilityConfig(method="s2s_plus_wrapped", **phase2_viewability),
+            **vast,
+        ),
+    }
+
+
 @pytest.fixture
-def sample_kargo_snippet() -> str:
-    """Sample Kargo creative snippet."""
-    return """
+def sample_runway_config(_runway_template) -> CreativeConfig:
+    """Sample Runway creative configuration."""
+    return _runway_template.model_copy(deep=True)
+
+
+@pytest.fixture
+def sample_video_config(_video_template) -> CreativeConfig:
+    """Sample video creative configuration."""
+    return _video_template.model_copy(deep=True)
+
+
+@pytest.fixture
+def sample_campaign_config(_campaign_template) -> CampaignConfig:
+    """Sample campaign configuration."""
+    return _campaign_template.model_copy(deep=True)
+
+
+_KARGO_SNIPPET = """
     <div class="kargo-creative">
         <script type="text/javascript">
             // Kargo creative code
@@ -183,11 +365,7 @@ def sample_kargo_snippet() -> str:
     </div>
     """
 
-
-@pytest.fixture
-def sample_vast_snippet() -> str:
-    """Sample VAST video snippet."""
-    return """
+_VAST_SNIPPET = """
     <?xml version="1.0" encoding="UTF-8"?>
     <VAST version="3.0">
         <Ad id="test_video_ad">
@@ -231,6 +409,18 @@ def sample_vast_snippet() -> str:
     """
 
 
+@pytest.fixture(scope="session")
+def sample_kargo_snippet() -> str:
+    """Sample Kargo creative snippet."""
+    return _KARGO_SNIPPET
+
+
+@pytest.fixture(scope="session")
+def sample_vast_snippet() -> str:
+    """Sample VAST video snippet."""
+    return _VAST_SNIPPET
+
+
 # Mock data and utilities
 @pytest.fixture
 def mock_amazon_response():
@@ -255,13 +445,13 @@ def mock_kargo_response(sample_kargo_snippet):
 
 
 # Test utilities
+@dataclass(frozen=True, slots=True)
 class MockHTTPResponse:
     """Mock HTTP response for testing."""
     
-    def __init__(self, json_data=None, status_code=200, text=None):
-        self.json_data = json_data
-        self.status_code = status_code
-        self.text = text or ""
+    json_data: Any = None
+    status_code: int = 200
+    text: str = ""
     
     def json(self):
         return self.json_data
@@ -274,11 +464,14 @@ class MockHTTPResponse:
 @pytest.fixture
 def mock_requests_success():
     """Mock successful HTTP requests."""
+    _ok = MockHTTPResponse({"success": True}, 200)
+    _created = MockHTTPResponse({"id": "12345", "status": "created"}, 201)
+    
     def _mock_get(*args, **kwargs):
-        return MockHTTPResponse({"success": True}, 200)
+        return _ok
     
     def _mock_post(*args, **kwargs):
-        return MockHTTPResponse({"id": "12345", "status": "created"}, 201)
+        return _created
     
     return {"get": _mock_get, "post": _mock_post}
 
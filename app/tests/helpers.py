@@ -0,0 +1,36 @@
+"""Shared test data and assertion helpers."""
+import re
+from functools import cache
+from typing import Final, Iterable, Pattern, Tuple
+
+from app.models.creative import ViewabilityConfig, ViewabilityPhase, ViewabilityVendor
+
+
+# Phase 1 with Amazon-native DoubleVerify only. The model is frozen and
+# vendors is a tuple, so this one instance can be shared by every test.
+PHASE1_DV_VIEWABILITY: Final = ViewabilityConfig(
+    phase=ViewabilityPhase.PHASE_1,
+    vendors=(ViewabilityVendor.DOUBLE_VERIFY,),
+    method="platform_native"
+)
+
+
+@cache
+def _needle_pattern(needles: Tuple[str, ...]) -> Pattern[str]:
+    # A lookahead matches at every position, so overlapping needles are found too
+    return re.compile("(?=(" + "|".join(re.escape(needle) for needle in needles) + "))")
+
+
+def assert_contains_all(haystack: str, needles: Iterable[str]) -> None:
+    """Assert every needle occurs in haystack, reporting all that are missing at once.
+    
+    All needles are found in a single scan of haystack. Only needles that the
+    scan missed, such as a prefix of another needle at the same position, are
+    checked again one by one.
+    """
+    wanted = tuple(dict.fromkeys(needles))
+    if not wanted:
+        return
+    found = set(_needle_pattern(wanted).findall(haystack))
+    missing = [needle for needle in wanted if needle not in found and needle not in haystack]
+    assert not missing, f"missing from output: {missing}"
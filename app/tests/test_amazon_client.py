@@ -11,21 +11,29 @@ from app.services.amazon_client import (
 )
 
 
-@pytest.mark.asyncio
+_default_upload_kwargs = {
+    "name": "Test",
+    "format": "CUSTOM_HTML",
+    # At least the mock's 50-character minimum, so the default upload succeeds
+    "creative_code": "<div>Test creative content with sufficient length</div>",
+    "width": 320,
+    "height": 50,
+    "advertiser_id": "123456",
+}
+
+
+def make_upload(**overrides) -> AmazonCreativeUploadRequest:
+    """Build an upload request from the shared defaults plus overrides."""
+    return AmazonCreativeUploadRequest(**{**_default_upload_kwargs, **overrides})
+
+
 class TestMockAmazonDSPClient:
     """Test mock Amazon DSP client functionality."""
     
     async def test_upload_creative_success(self):
         """Test successful creative upload."""
         async with MockAmazonDSPClient() as client:
-            request = AmazonCreativeUploadRequest(
-                name="Test Creative",
-                format="CUSTOM_HTML",
-                creative_code="<div>Test creative content</div>",
-                width=320,
-                height=50,
-                advertiser_id="123456"
-            )
+            request = make_upload(name="Test Creative")
             
             response = await client.upload_creative(request)
             
@@ -35,52 +43,36 @@ class TestMockAmazonDSPClient:
             assert response.creative_id.startswith("creative_")
             assert isinstance(response.created_at, datetime)
     
-    async def test_upload_creative_validation_error(self):
-        """Test creative upload with validation error."""
-        async with MockAmazonDSPClient() as client:
-            request = AmazonCreativeUploadRequest(
-                name="Invalid Creative",
-                format="CUSTOM_HTML",
-                creative_code="<div>Short</div>",  # Too short, triggers validation error
-                width=320,
-                height=50,
-                advertiser_id="123456"
-            )
-            
-            with pytest.raises(Exception) as exc_info:
-                await client.upload_creative(request)
-            
-            assert "Creative code too short" in str(exc_info.value)
-    
-    async def test_upload_creative_invalid_dimensions(self):
-        """Test creative upload with invalid dimensions."""
+    @pytest.mark.parametrize(
+        "overrides, err",
+        [
+            # Too short, triggers validation error
+            ({"creative_code": "<div>Short</div>"}, "Creative code too short"),
+            (
+                {
+                    "creative_code": "<div>Valid creative content with sufficient length</div>",
+                    "width": 0,
+                },
+                "Invalid dimensions",
+            ),
+        ],
+        ids=["code_too_short", "invalid_dimensions"],
+    )
+    async def test_upload_creative_validation_error(self, overrides, err):
+        """Test creative upload rejects invalid requests."""
         async with MockAmazonDSPClient() as client:
-            request = AmazonCreativeUploadRequest(
-                name="Invalid Dimensions",
-                format="CUSTOM_HTML",
-                creative_code="<div>Valid creative content with sufficient length</div>",
-                width=0,  # Invalid width
-                height=50,
-                advertiser_id="123456"
-            )
+            request = make_upload(name="Invalid Creative", **overrides)
             
             with pytest.raises(Exception) as exc_info:
                 await client.upload_creative(request)
             
-            assert "Invalid dimensions" in str(exc_info.value)
+            assert err in str(exc_info.value)
     
     async def test_get_creative_success(self):
         """Test successful creative retrieval."""
         async with MockAmazonDSPClient() as client:
             # First upload a creative
-            upload_request = AmazonCreativeUploadRequest(
-                name="Test Get Creative",
-                format="CUSTOM_HTML",
-                creative_code="<div>Test creative for retrieval</div>",
-                width=320,
-                height=50,
-                advertiser_id="123456"
-            )
+            upload_request = make_upload(name="Test Get Creative")
             
             upload_response = await client.upload_creative(upload_request)
             creative_id = upload_response.creative_id
@@ -167,19 +159,30 @@ class TestMockAmazonDSPClient:
         """Test batch creative upload."""
         async with MockAmazonDSPClient() as client:
             requests = [
-                AmazonCreativeUploadRequest(
+                make_upload(
                     name=f"Batch Creative {i}",
-                    format="CUSTOM_HTML",
-                    creative_code=f"<div>Batch creative content {i}</div>",
-                    width=320,
-                    height=50,
-                    advertiser_id="123456"
+                    creative_code=f"<div>Batch creative content {i} with sufficient length</div>",
                 )
                 for i in range(3)
             ]
             
+            # Count uploads in flight to check they overlap, without timing them
+            upload = client.upload_creative
+            in_flight = peak_in_flight = 0
+            
+            async def tracking_upload(request):
+                nonlocal in_flight, peak_in_flight
+                in_flight += 1
+                peak_in_flight = max(peak_in_flight, in_flight)
+                try:
+                    return await upload(request)
+                finally:
+                    in_flight -= 1
+            
+            client.upload_creative = tracking_upload
             responses = await client.batch_upload_creatives(requests)
             
+            assert peak_in_flight == 3
             assert len(responses) == 3
             for i, response in enumerate(responses):
                 assert response.name == f"Batch Creative {i}"
@@ -190,43 +193,26 @@ class TestMockAmazonDSPClient:
         async with MockAmazonDSPClient() as client:
             requests = [
                 # Valid creative
-                AmazonCreativeUploadRequest(
-                    name="Valid Creative",
-                    format="CUSTOM_HTML",
-                    creative_code="<div>Valid creative content</div>",
-                    width=320,
-                    height=50,
-                    advertiser_id="123456"
-                ),
+                make_upload(name="Valid Creative"),
                 # Invalid creative (too short)
-                AmazonCreativeUploadRequest(
+                make_upload(
                     name="Invalid Creative",
-                    format="CUSTOM_HTML",
                     creative_code="<div>Bad</div>",  # Too short
-                    width=320,
-                    height=50,
-                    advertiser_id="123456"
                 ),
             ]
             
             responses = await client.batch_upload_creatives(requests)
             
-            # Should only get response for valid creative
-            assert len(responses) == 1
+            # One entry per request, in order, with None for the failed upload
+            assert len(responses) == 2
             assert responses[0].name == "Valid Creative"
+            assert responses[1] is None
     
     async def test_mock_data_summary(self):
         """Test mock data summary functionality."""
         async with MockAmazonDSPClient() as client:
             # Upload some test data
-            creative_request = AmazonCreativeUploadRequest(
-                name="Summary Test Creative",
-                format="CUSTOM_HTML",
-                creative_code="<div>Test creative for summary</div>",
-                width=320,
-                height=50,
-                advertiser_id="123456"
-            )
+            creative_request = make_upload(name="Summary Test Creative")
             
             campaign_request = AmazonCampaignRequest(
                 advertiser_id="123456",
@@ -264,18 +250,12 @@ class TestMockAmazonDSPClient:
             assert token2.startswith("refreshed_token_")
             assert token2 != token1
     
-    @patch('time.sleep')  # Mock sleep to speed up tests
+    # Mock the client's asyncio.sleep to speed up tests
+    @patch('app.services.amazon_client.asyncio.sleep', new_callable=AsyncMock)
     async def test_api_latency_simulation(self, mock_sleep):
         """Test that API latency simulation is working."""
         async with MockAmazonDSPClient() as client:
-            request = AmazonCreativeUploadRequest(
-                name="Latency Test",
-                format="CUSTOM_HTML",
-                creative_code="<div>Testing latency simulation</div>",
-                width=320,
-                height=50,
-                advertiser_id="123456"
-            )
+            request = make_upload(name="Latency Test")
             
             await client.upload_creative(request)
             
@@ -283,7 +263,6 @@ class TestMockAmazonDSPClient:
             assert mock_sleep.called
 
 
-@pytest.mark.asyncio
 class TestAmazonClientIntegration:
     """Integration tests for Amazon client."""
     
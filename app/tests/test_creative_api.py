@@ -1,48 +1,132 @@
 """Tests for creative processing API endpoints."""
+from typing import Any, Dict, Union
+
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-from httpx import AsyncClient
+import pytest_asyncio
+from httpx import AsyncClient, Response
+from pydantic import ValidationError
+
+from app.models.creative import CreativeConfig, CreativeFormat, ViewabilityPhase
+from app.models.database import Base
+from app.tests.helpers import assert_contains_all
+
+
+def decode_json(response: Response) -> Any:
+    """Decode a response body once with orjson."""
+    return orjson.loads(response.content)
+
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+async def post_json(
+    client: AsyncClient, url: str, payload: Union[bytes, Any], **kwargs: Any
+) -> Response:
+    """POST a payload as JSON, encoding it with orjson unless it is already bytes."""
+    content = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+    return await client.post(url, content=content, headers=JSON_HEADERS, **kwargs)
+
+
+PHASE1_DISPLAY_MARKERS = ('data-phase="phase_1"', "amazon-dsp-display-wrapper")
+
+PHASE2_VAST_MARKERS = ("<?xml version", '<VAST version="3.0">', "IAS_S2S", "KARGO_DSP_SEAT_001")
+
+
+# Runway / Phase 1 / platform_native body shared by most tests; tests spread it
+# and override only the fields they care about.
+BASE_RUNWAY_PHASE1 = {
+    "creative_config": {
+        "name": "Runway Phase 1 Creative",
+        "format": "runway",
+        "dimensions": "320x50",
+        "snippet_url": "https://snippet.kargo.com/snippet/dm/12345",
+        "viewability_config": {
+            "phase": "phase_1",
+            "vendors": ["double_verify"],
+            "method": "platform_native"
+        }
+    }
+}
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def _reset_state(test_engine):
+    """Wipe tables once per module instead of after every test.
+    
+    No test here depends on an empty database, which lets the processed
+    creative below be shared by the read-only tests.
+    """
+    yield
+    
+    async with test_engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
 
-from app.models.creative import CreativeFormat, ViewabilityPhase
+
+async def _process_slim(async_client: AsyncClient, name: str) -> Dict[str, str]:
+    """Process a Runway creative and return its ID and resource URL."""
+    request_data = {
+        "creative_config": {**BASE_RUNWAY_PHASE1["creative_config"], "name": name}
+    }
+    response = await post_json(
+        async_client, "/api/v1/creative/process", request_data, params={"slim": "true"}
+    )
+    assert response.status_code == 200
+    creative_id = decode_json(response)["creative_id"]
+    return {"id": creative_id, "url": f"/api/v1/creative/{creative_id}"}
+
+
+@pytest_asyncio.fixture(scope="module")
+async def processed_creative(async_client: AsyncClient) -> Dict[str, str]:
+    """Process a Runway creative once and share its ID and URL."""
+    return await _process_slim(async_client, "Get Test Creative")
+
+
+@pytest_asyncio.fixture
+async def throwaway_creative(async_client: AsyncClient) -> Dict[str, str]:
+    """Process a creative that the test is free to delete."""
+    return await _process_slim(async_client, "Delete Test Creative")
 
 
 class TestCreativeAPI:
     """Test creative processing API endpoints."""
     
-    def test_process_creative_runway_phase1(self, test_client: TestClient):
+    async def test_process_creative_runway_phase1(self, async_client: AsyncClient):
         """Test processing Runway creative via API - Phase 1."""
         request_data = {
             "creative_config": {
+                **BASE_RUNWAY_PHASE1["creative_config"],
                 "name": "API_Test_Runway_Phase1",
-                "format": "runway",
-                "dimensions": "320x50",
                 "snippet_url": "https://snippet.kargo.com/snippet/dm/81298",
                 "device_type": "mobile",
-                "viewability_config": {
-                    "phase": "phase_1",
-                    "vendors": ["double_verify"],
-                    "method": "platform_native"
-                }
             }
         }
         
-        response = test_client.post("/api/v1/creative/process", json=request_data)
+        response = await post_json(async_client, "/api/v1/creative/process", request_data)
         
         assert response.status_code == 200
-        data = response.json()
-        
-        assert data["name"] == "API_Test_Runway_Phase1"
-        assert data["format"] == "runway"
-        assert data["amazon_dsp_ready"] is True
-        assert data["viewability_config"]["phase"] == "phase_1"
-        assert "creative_id" in data
-        assert len(data["processed_code"]) > 0
-        
-        # Check Phase 1 specific elements
-        assert 'data-phase="phase_1"' in data["processed_code"]
-        assert "amazon-dsp-display-wrapper" in data["processed_code"]
+        data = decode_json(response)
+        
+        code = data["processed_code"]
+        
+        # One structural comparison so a failure reports every mismatch at once
+        assert {
+            "name": data["name"],
+            "format": data["format"],
+            "amazon_dsp_ready": data["amazon_dsp_ready"],
+            "phase": data["viewability_config"]["phase"],
+            "has_creative_id": bool(data.get("creative_id")),
+        } == {
+            "name": "API_Test_Runway_Phase1",
+            "format": "runway",
+            "amazon_dsp_ready": True,
+            "phase": "phase_1",
+            "has_creative_id": True,
+        }
+        assert_contains_all(code, PHASE1_DISPLAY_MARKERS)
     
-    def test_process_creative_video_phase2(self, test_client: TestClient):
+    async def test_process_creative_video_phase2(self, async_client: AsyncClient):
         """Test processing video creative via API - Phase 2."""
         request_data = {
             "creative_config": {
@@ -64,123 +148,89 @@ class TestCreativeAPI:
             }
         }
         
-        response = test_client.post("/api/v1/creative/process", json=request_data)
+        response = await post_json(async_client, "/api/v1/creative/process", request_data)
         
         assert response.status_code == 200
-        data = response.json()
-        
-        assert data["name"] == "API_Test_Video_Phase2"
-        assert data["format"] == "enhanced_preroll"
-        assert data["viewability_config"]["phase"] == "phase_2"
-        assert data["viewability_config"]["ias_s2s_enabled"] is True
-        
-        # Check Phase 2 VAST elements
-        assert "<?xml version" in data["processed_code"]
-        assert "<VAST version=\"3.0\">" in data["processed_code"]
-        assert "IAS_S2S" in data["processed_code"]
-        assert "KARGO_DSP_SEAT_001" in data["processed_code"]
+        data = decode_json(response)
+        
+        code = data["processed_code"]
+        
+        assert {
+            "name": data["name"],
+            "format": data["format"],
+            "phase": data["viewability_config"]["phase"],
+            "ias_s2s_enabled": data["viewability_config"]["ias_s2s_enabled"],
+        } == {
+            "name": "API_Test_Video_Phase2",
+            "format": "enhanced_preroll",
+            "phase": "phase_2",
+            "ias_s2s_enabled": True,
+        }
+        assert_contains_all(code, PHASE2_VAST_MARKERS)
     
-    def test_process_creative_invalid_config(self, test_client: TestClient):
-        """Test processing creative with invalid configuration."""
-        request_data = {
-            "creative_config": {
-                "name": "",  # Empty name should fail validation
-                "format": "runway",
-                "dimensions": "invalid",  # Invalid dimensions
-                "snippet_url": "https://snippet.kargo.com/snippet/dm/81298",
-                "viewability_config": {
-                    "phase": "phase_1",
-                    "vendors": ["double_verify"],
-                    "method": "platform_native"
-                }
-            }
+    def test_process_creative_invalid_config(self):
+        """Test that an invalid configuration is rejected by the request model."""
+        config = {
+            **BASE_RUNWAY_PHASE1["creative_config"],
+            "name": "",
+            "dimensions": "invalid",  # Invalid dimensions
+            "snippet_url": "https://snippet.kargo.com/snippet/dm/81298",
         }
         
-        response = test_client.post("/api/v1/creative/process", json=request_data)
-        assert response.status_code == 422  # Validation error
+        with pytest.raises(ValidationError):
+            CreativeConfig(**config)
     
-    def test_process_creative_invalid_snippet_url(self, test_client: TestClient):
+    async def test_process_creative_invalid_snippet_url(self, async_client: AsyncClient):
         """Test processing creative with invalid snippet URL."""
         request_data = {
             "creative_config": {
+                **BASE_RUNWAY_PHASE1["creative_config"],
                 "name": "Invalid URL Test",
-                "format": "runway",
-                "dimensions": "320x50",
                 "snippet_url": "https://invalid.com/snippet",  # Invalid URL
-                "viewability_config": {
-                    "phase": "phase_1",
-                    "vendors": ["double_verify"],
-                    "method": "platform_native"
-                }
             }
         }
         
-        response = test_client.post("/api/v1/creative/process", json=request_data)
+        response = await post_json(async_client, "/api/v1/creative/process", request_data)
         assert response.status_code == 500  # Server error due to invalid URL
     
-    def test_get_processed_creative(self, test_client: TestClient):
+    async def test_get_processed_creative(
+        self, async_client: AsyncClient, processed_creative: Dict[str, str]
+    ):
         """Test retrieving processed creative by ID."""
-        # First, process a creative
-        request_data = {
-            "creative_config": {
-                "name": "Get Test Creative",
-                "format": "runway",
-                "dimensions": "320x50",
-                "snippet_url": "https://snippet.kargo.com/snippet/dm/12345",
-                "viewability_config": {
-                    "phase": "phase_1",
-                    "vendors": ["double_verify"],
-                    "method": "platform_native"
-                }
-            }
-        }
-        
-        process_response = test_client.post("/api/v1/creative/process", json=request_data)
-        assert process_response.status_code == 200
-        
-        creative_id = process_response.json()["creative_id"]
-        
-        # Now retrieve it
-        get_response = test_client.get(f"/api/v1/creative/{creative_id}")
+        get_response = await async_client.get(processed_creative["url"])
         
         assert get_response.status_code == 200
-        data = get_response.json()
+        data = decode_json(get_response)
         
-        assert data["creative_id"] == creative_id
+        assert data["creative_id"] == processed_creative["id"]
         assert data["name"] == "Get Test Creative"
         assert data["amazon_dsp_ready"] is True
     
-    def test_get_nonexistent_creative(self, test_client: TestClient):
+    async def test_get_nonexistent_creative(self, async_client: AsyncClient):
         """Test retrieving non-existent creative."""
-        response = test_client.get("/api/v1/creative/nonexistent-id")
+        response = await async_client.get("/api/v1/creative/nonexistent-id")
         assert response.status_code == 404
     
-    def test_list_processed_creatives(self, test_client: TestClient):
+    async def test_list_processed_creatives(self, async_client: AsyncClient):
         """Test listing processed creatives."""
-        # Process multiple creatives first
-        for i in range(3):
-            request_data = {
-                "creative_config": {
-                    "name": f"List Test Creative {i}",
-                    "format": "runway",
-                    "dimensions": "320x50",
-                    "snippet_url": "https://snippet.kargo.com/snippet/dm/12345",
-                    "viewability_config": {
-                        "phase": "phase_1",
-                        "vendors": ["double_verify"],
-                        "method": "platform_native"
-                    }
-                }
-            }
-            
-            response = test_client.post("/api/v1/creative/process", json=request_data)
-            assert response.status_code == 200
+        # Seed three creatives with a single bulk request
+        bulk_payload = {
+            "creative_configs": [
+                {**BASE_RUNWAY_PHASE1["creative_config"], "name": f"List Test Creative {i}"}
+                for i in range(3)
+            ],
+            "advertiser_id": "123456",
+        }
+        
+        response = await post_json(async_client, "/api/v1/creative/process/bulk", bulk_payload)
+        assert response.status_code == 200
+        assert decode_json(response)["successful"] == 3
         
         # List creatives
-        list_response = test_client.get("/api/v1/creative/")
+        list_response = await async_client.get("/api/v1/creative/")
         
         assert list_response.status_code == 200
-        data = list_response.json()
+        data = decode_json(list_response)
         
         assert isinstance(data, list)
         assert len(data) >= 3
@@ -192,76 +242,89 @@ class TestCreativeAPI:
             assert "format" in creative
             assert "amazon_dsp_ready" in creative
     
-    def test_list_creatives_with_pagination(self, test_client: TestClient):
-        """Test listing creatives with pagination parameters."""
-        response = test_client.get("/api/v1/creative/?skip=0&limit=2")
+    async def test_list_creatives_with_pagination(self, async_client: AsyncClient):
+        """Test listing creatives with offset and keyset pagination."""
+        bulk_payload = {
+            "creative_configs": [
+                {**BASE_RUNWAY_PHASE1["creative_config"], "name": f"Page Test Creative {i}"}
+                for i in range(4)
+            ],
+            "advertiser_id": "123456",
+        }
+        response = await post_json(async_client, "/api/v1/creative/process/bulk", bulk_payload)
+        assert response.status_code == 200
         
+        # Offset pagination (backward compatible)
+        response = await async_client.get("/api/v1/creative/?skip=0&limit=2")
         assert response.status_code == 200
-        data = response.json()
+        first_page = decode_json(response)
+        assert len(first_page) == 2
         
-        assert isinstance(data, list)
-        assert len(data) <= 2  # Should respect limit
-    
-    def test_delete_processed_creative(self, test_client: TestClient):
-        """Test deleting processed creative."""
-        # First, process a creative
-        request_data = {
-            "creative_config": {
-                "name": "Delete Test Creative",
-                "format": "runway",
-                "dimensions": "320x50",
-                "snippet_url": "https://snippet.kargo.com/snippet/dm/12345",
-                "viewability_config": {
-                    "phase": "phase_1",
-                    "vendors": ["double_verify"],
-                    "method": "platform_native"
-                }
-            }
-        }
+        response = await async_client.get("/api/v1/creative/?skip=2&limit=2")
+        assert response.status_code == 200
+        offset_page = decode_json(response)
         
-        process_response = test_client.post("/api/v1/creative/process", json=request_data)
-        assert process_response.status_code == 200
+        # Keyset pagination continues from the last creative of the first page
+        last_id = first_page[-1]["creative_id"]
+        response = await async_client.get(f"/api/v1/creative/?after={last_id}&limit=2")
+        assert response.status_code == 200
+        keyset_page = decode_json(response)
         
-        creative_id = process_response.json()["creative_id"]
+        assert len(keyset_page) == 2
+        assert [c["creative_id"] for c in keyset_page] == [c["creative_id"] for c in offset_page]
+        assert not {c["creative_id"] for c in keyset_page} & {c["creative_id"] for c in first_page}
+    
+    async def test_list_creatives_unknown_cursor(self, async_client: AsyncClient):
+        """Test an ``after`` cursor that matches no creative is rejected."""
+        response = await async_client.get("/api/v1/creative/?after=nonexistent-id")
         
+        assert response.status_code == 400
+        assert "nonexistent-id" in decode_json(response)["detail"]
+    
+    async def test_list_creatives_rejects_skip_with_cursor(
+        self, async_client: AsyncClient, processed_creative: Dict[str, str]
+    ):
+        """Test offset and keyset pagination can't be mixed in one request."""
+        response = await async_client.get(
+            f"/api/v1/creative/?after={processed_creative['id']}&skip=20"
+        )
+        
+        assert response.status_code == 400
+    
+    async def test_delete_processed_creative(
+        self, async_client: AsyncClient, throwaway_creative: Dict[str, str]
+    ):
+        """Test deleting processed creative."""
         # Delete it
-        delete_response = test_client.delete(f"/api/v1/creative/{creative_id}")
+        delete_response = await async_client.delete(throwaway_creative["url"])
         
         assert delete_response.status_code == 200
-        assert "deleted successfully" in delete_response.json()["message"]
+        data = decode_json(delete_response)
+        assert "deleted successfully" in data["message"]
         
         # Verify it's gone
-        get_response = test_client.get(f"/api/v1/creative/{creative_id}")
+        get_response = await async_client.get(throwaway_creative["url"])
         assert get_response.status_code == 404
     
-    def test_delete_nonexistent_creative(self, test_client: TestClient):
+    async def test_delete_nonexistent_creative(self, async_client: AsyncClient):
         """Test deleting non-existent creative."""
-        response = test_client.delete("/api/v1/creative/nonexistent-id")
+        response = await async_client.delete("/api/v1/creative/nonexistent-id")
         assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 class TestCreativeAPIAsync:
     """Async tests for creative processing API."""
     
     async def test_process_creative_bulk(self, async_client: AsyncClient):
         """Test bulk creative processing."""
-        request_data = [
-            {
-                "creative_config": {
+        request_data = {
+            "creative_configs": [
+                {
+                    **BASE_RUNWAY_PHASE1["creative_config"],
                     "name": "Bulk Test Creative 1",
-                    "format": "runway",
-                    "dimensions": "320x50",
                     "snippet_url": "https://snippet.kargo.com/snippet/dm/81298",
-                    "viewability_config": {
-                        "phase": "phase_1",
-                        "vendors": ["double_verify"],
-                        "method": "platform_native"
-                    }
-                }
-            },
-            {
-                "creative_config": {
+                },
+                {
                     "name": "Bulk Test Creative 2",
                     "format": "enhanced_preroll",
                     "dimensions": "300x50",
@@ -272,89 +335,106 @@ class TestCreativeAPIAsync:
                         "vendors": ["double_verify"],
                         "method": "vast_wrapped"
                     }
-                }
-            }
-        ]
+                },
+            ],
+            "advertiser_id": "123456",
+        }
         
-        response = await async_client.post("/api/v1/creative/process/bulk", json=request_data)
+        response = await post_json(async_client, "/api/v1/creative/process/bulk", request_data)
         
         assert response.status_code == 200
-        data = response.json()
+        data = decode_json(response)
         
-        assert isinstance(data, list)
-        assert len(data) == 2
+        assert data["successful"] == 2
+        assert len(data["results"]) == 2
         
-        # Check both creatives were processed
-        assert data[0]["name"] == "Bulk Test Creative 1"
-        assert data[0]["format"] == "runway"
-        assert data[1]["name"] == "Bulk Test Creative 2"
-        assert data[1]["format"] == "enhanced_preroll"
+        # Check both creatives were processed, in request order
+        assert data["results"][0]["name"] == "Bulk Test Creative 1"
+        assert data["results"][0]["format"] == "runway"
+        assert data["results"][1]["name"] == "Bulk Test Creative 2"
+        assert data["results"][1]["format"] == "enhanced_preroll"
     
     async def test_process_creative_bulk_partial_failure(self, async_client: AsyncClient):
         """Test bulk processing with some failures."""
-        request_data = [
-            {
-                "creative_config": {
+        request_data = {
+            "creative_configs": [
+                {
+                    **BASE_RUNWAY_PHASE1["creative_config"],
                     "name": "Valid Creative",
-                    "format": "runway",
-                    "dimensions": "320x50",
-                    "snippet_url": "https://snippet.kargo.com/snippet/dm/12345",
-                    "viewability_config": {
-                        "phase": "phase_1",
-                        "vendors": ["double_verify"],
-                        "method": "platform_native"
-                    }
-                }
-            },
-            {
-                "creative_config": {
+                },
+                {
+                    **BASE_RUNWAY_PHASE1["creative_config"],
                     "name": "Invalid Creative",
-                    "format": "runway",
-                    "dimensions": "320x50",
                     "snippet_url": "https://invalid.com/snippet",  # Invalid URL
-                    "viewability_config": {
-                        "phase": "phase_1",
-                        "vendors": ["double_verify"],
-                        "method": "platform_native"
-                    }
-                }
-            }
-        ]
+                },
+            ],
+            "advertiser_id": "123456",
+        }
         
-        response = await async_client.post("/api/v1/creative/process/bulk", json=request_data)
+        response = await post_json(async_client, "/api/v1/creative/process/bulk", request_data)
         
         assert response.status_code == 200
-        data = response.json()
+        data = decode_json(response)
         
         # Should only return the successful one
-        assert isinstance(data, list)
-        assert len(data) == 1
-        assert data[0]["name"] == "Valid Creative"
+        assert data["total_processed"] == 2
+        assert len(data["results"]) == 1
+        assert data["results"][0]["name"] == "Valid Creative"
+        assert data["failed_items"][0]["creative_name"] == "Invalid Creative"
 
 
 class TestCreativeAPIValidation:
     """Test API input validation."""
     
-    def test_phase1_ias_validation_error(self, test_client: TestClient):
-        """Test that Phase 1 with IAS vendors returns validation error."""
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            pytest.param(
+                {"viewability_config": {
+                    **BASE_RUNWAY_PHASE1["creative_config"]["viewability_config"],
+                    "vendors": ["ias", "double_verify"],  # IAS not allowed in Phase 1
+                }},
+                id="phase1_with_ias",
+            ),
+            pytest.param(
+                {"viewability_config": {
+                    "phase": "phase_2",
+                    "vendors": ["double_verify"],  # Phase 2 needs IAS and DV
+                    "method": "s2s_plus_native",
+                }},
+                id="phase2_single_vendor",
+            ),
+            pytest.param({"format": "invalid_format"}, id="invalid_format"),
+            pytest.param({"dimensions": "320by50"}, id="invalid_dimensions"),
+            pytest.param({"device_type": "smartwatch"}, id="invalid_device_type"),
+            pytest.param({"viewability_config": None}, id="missing_viewability_config"),
+        ],
+    )
+    def test_invalid_config_rejected(self, overrides):
+        """Test that invalid creative configs fail model validation."""
+        config = {
+            **BASE_RUNWAY_PHASE1["creative_config"],
+            "name": "Invalid Config",
+            **overrides,
+        }
+        
+        with pytest.raises(ValidationError):
+            CreativeConfig(**config)
+    
+    async def test_invalid_config_returns_422(self, async_client: AsyncClient):
+        """Test that request validation errors surface as 422 through the API."""
         request_data = {
             "creative_config": {
-                "name": "Invalid Phase 1 Config",
-                "format": "runway",
-                "dimensions": "320x50",
-                "snippet_url": "https://snippet.kargo.com/snippet/dm/12345",
-                "viewability_config": {
-                    "phase": "phase_1",
-                    "vendors": ["ias", "double_verify"],  # IAS not allowed in Phase 1
-                    "method": "platform_native"
-                }
+                **BASE_RUNWAY_PHASE1["creative_config"],
+                "name": "Invalid Format Test",
+                "format": "invalid_format",  # Not a valid CreativeFormat
             }
         }
         
-        response = test_client.post("/api/v1/creative/process", json=request_data)
+        response = await post_json(async_client, "/api/v1/creative/process", request_data)
         assert response.status_code == 422
     
-    def test_phase2_missing_s2s_config(self, test_client: TestClient):
+    async def test_phase2_missing_s2s_config(self, async_client: AsyncClient):
         """Test that Phase 2 without S2S config returns validation error."""
         request_data = {
             "creative_config": {
@@ -371,30 +451,11 @@ class TestCreativeAPIValidation:
             }
         }
         
-        response = test_client.post("/api/v1/creative/process", json=request_data)
+        response = await post_json(async_client, "/api/v1/creative/process", request_data)
         # This should still work but may generate warnings in processing metadata
         assert response.status_code in [200, 422]
     
-    def test_invalid_creative_format(self, test_client: TestClient):
-        """Test invalid creative format returns validation error."""
-        request_data = {
-            "creative_config": {
-                "name": "Invalid Format Test",
-                "format": "invalid_format",  # Not a valid CreativeFormat
-                "dimensions": "320x50",
-                "snippet_url": "https://snippet.kargo.com/snippet/dm/12345",
-                "viewability_config": {
-                    "phase": "phase_1",
-                    "vendors": ["double_verify"],
-                    "method": "platform_native"
-                }
-            }
-        }
-        
-        response = test_client.post("/api/v1/creative/process", json=request_data)
-        assert response.status_code == 422
-    
-    def test_missing_video_duration(self, test_client: TestClient):
+    async def test_missing_video_duration(self, async_client: AsyncClient):
         """Test video creative without duration."""
         request_data = {
             "creative_config": {
@@ -411,6 +472,6 @@ class TestCreativeAPIValidation:
             }
         }
         
-        response = test_client.post("/api/v1/creative/process", json=request_data)
+        response = await post_json(async_client, "/api/v1/creative/process", request_data)
         # Should still work with default duration from snippet
         assert response.status_code == 200
\ No newline at end of file
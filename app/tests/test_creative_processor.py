@@ -1,8 +1,12 @@
 """Tests for creative processing service."""
+from datetime import datetime
+
 import pytest
-from unittest.mock import AsyncMock, Mock
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.database import ProcessedCreativeDB
 from app.services.creative_processor import CreativeProcessor, SnippetTransformer
 from app.models.creative import (
     CreativeConfig,
@@ -12,6 +16,17 @@ from app.models.creative import (
     ViewabilityVendor,
     DeviceType,
 )
+from app.tests.helpers import PHASE1_DV_VIEWABILITY, assert_contains_all
+
+
+# Valid as a model; the processor rejects the non-Kargo snippet URL
+_INVALID_URL_CONFIG = CreativeConfig(
+    name="Invalid URL Test",
+    format=CreativeFormat.RUNWAY,
+    dimensions="320x50",
+    snippet_url="https://invalid-domain.com/snippet",
+    viewability_config=PHASE1_DV_VIEWABILITY
+)
 
 
 class TestSnippetTransformer:
@@ -57,119 +72,72 @@ class TestSnippetTransformer:
         assert "123456789" in processed
         assert "${CACHEBUSTER}" not in processed
     
-    def test_wrap_display_html5_phase1(self):
+    def test_wrap_display_html5_phase1(self, config_catalog):
         """Test Phase 1 display wrapper."""
-        config = CreativeConfig(
-            name="Test Runway",
-            format=CreativeFormat.RUNWAY,
-            dimensions="320x50",
-            snippet_url="https://snippet.kargo.com/snippet/dm/12345",
-            device_type=DeviceType.MOBILE,
-            viewability_config=ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_1,
-                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                method="platform_native"
-            )
-        )
+        config = config_catalog["display_phase1"]
         
         snippet_code = "<div>Original creative</div>"
         wrapped = SnippetTransformer.wrap_display_html5_phase1(snippet_code, config)
         
-        assert 'data-phase="phase_1"' in wrapped
-        assert '"viewability_vendor": "double_verify"' in wrapped
-        assert '"viewability_method": "platform_native"' in wrapped
-        assert "Original creative" in wrapped
-        assert "amazonDSPConfig" in wrapped
+        assert_contains_all(wrapped, (
+            'data-phase="phase_1"',
+            '"viewability_vendor":"double_verify"',
+            '"viewability_method":"platform_native"',
+            "Original creative",
+            "amazonDSPConfig",
+        ))
     
-    def test_wrap_display_html5_phase2(self):
+    def test_wrap_display_html5_phase2(self, config_catalog):
         """Test Phase 2 display wrapper."""
-        config = CreativeConfig(
-            name="Test Runway Phase 2",
-            format=CreativeFormat.RUNWAY,
-            dimensions="320x50",
-            snippet_url="https://snippet.kargo.com/snippet/dm/12345",
-            device_type=DeviceType.MOBILE,
-            viewability_config=ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_2,
-                vendors=[ViewabilityVendor.IAS, ViewabilityVendor.DOUBLE_VERIFY],
-                method="s2s_plus_native",
-                ias_s2s_enabled=True,
-                dsp_seat_id="KARGO_DSP_SEAT_001",
-                pub_id="kargo_test_pub"
-            )
-        )
+        config = config_catalog["display_phase2"]
         
         snippet_code = "<div>Original creative</div>"
         wrapped = SnippetTransformer.wrap_display_html5_phase2(snippet_code, config)
         
-        assert 'data-phase="phase_2"' in wrapped
-        assert '"viewability_vendors": ["ias", "double_verify"]' in wrapped
-        assert '"ias_s2s_enabled": true' in wrapped
-        assert '"dsp_seat_id": "KARGO_DSP_SEAT_001"' in wrapped
-        assert "ias-s2s-config" in wrapped
-        assert "Original creative" in wrapped
+        assert_contains_all(wrapped, (
+            'data-phase="phase_2"',
+            '"viewability_vendors":["ias","double_verify"]',
+            '"ias_s2s_enabled":true',
+            '"dsp_seat_id":"KARGO_DSP_SEAT_001"',
+            "ias-s2s-config",
+            "Original creative",
+        ))
     
-    def test_wrap_vast_phase1(self):
+    def test_wrap_vast_phase1(self, config_catalog):
         """Test Phase 1 VAST wrapper."""
-        config = CreativeConfig(
-            name="Test Video",
-            format=CreativeFormat.ENHANCED_PREROLL,
-            dimensions="300x50",
-            snippet_url="https://snippet.kargo.com/snippet/dm/67890",
-            device_type=DeviceType.MOBILE,
-            duration=15,
-            branded_canvas=True,
-            viewability_config=ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_1,
-                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                method="vast_wrapped"
-            )
-        )
+        config = config_catalog["vast_phase1"]
         
         wrapped = SnippetTransformer.wrap_vast_phase1("", config)
         
-        assert '<?xml version="1.0" encoding="UTF-8"?>' in wrapped
-        assert '<VAST version="3.0">' in wrapped
-        assert "Test Video_phase1" in wrapped
-        assert "Kargo Amazon DSP Phase 1" in wrapped
-        assert "<Duration>00:00:15</Duration>" in wrapped
-        assert "doubleverify.com" in wrapped
-        assert "CompanionAds" in wrapped  # Branded canvas enabled
-        assert "${AMAZON_CLICK_URL}" in wrapped
+        assert_contains_all(wrapped, (
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            '<VAST version="3.0">',
+            "Test Video_phase1",
+            "Kargo Amazon DSP Phase 1",
+            "<Duration>00:00:15</Duration>",
+            "doubleverify.com",
+            "CompanionAds",  # Branded canvas enabled
+            "${AMAZON_CLICK_URL}",
+        ))
     
-    def test_wrap_vast_phase2(self):
+    def test_wrap_vast_phase2(self, config_catalog):
         """Test Phase 2 VAST wrapper."""
-        config = CreativeConfig(
-            name="Test Video Phase 2",
-            format=CreativeFormat.ENHANCED_PREROLL,
-            dimensions="300x50",
-            snippet_url="https://snippet.kargo.com/snippet/dm/67890",
-            device_type=DeviceType.MOBILE,
-            duration=15,
-            branded_canvas=False,
-            viewability_config=ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_2,
-                vendors=[ViewabilityVendor.IAS, ViewabilityVendor.DOUBLE_VERIFY],
-                method="s2s_plus_wrapped",
-                ias_s2s_enabled=True,
-                dsp_seat_id="KARGO_DSP_SEAT_001",
-                pub_id="kargo_test_pub"
-            )
-        )
+        config = config_catalog["vast_phase2"]
         
         wrapped = SnippetTransformer.wrap_vast_phase2("", config)
         
-        assert '<VAST version="3.0">' in wrapped
-        assert "Test Video Phase 2_phase2" in wrapped
-        assert "Kargo Amazon DSP Phase 2" in wrapped
-        assert "IAS_S2S" in wrapped
-        assert "KARGO_DSP_SEAT_001" in wrapped
-        assert "kargo_test_pub" in wrapped
+        assert_contains_all(wrapped, (
+            '<VAST version="3.0">',
+            "Test Video Phase 2_phase2",
+            "Kargo Amazon DSP Phase 2",
+            "IAS_S2S",
+            "KARGO_DSP_SEAT_001",
+            "kargo_test_pub",
+            "DualVendorEnabled",
+        ))
         assert "CompanionAds" not in wrapped  # Branded canvas disabled
-        assert "DualVendorEnabled" in wrapped
 
 
-@pytest.mark.asyncio
 class TestCreativeProcessor:
     """Test creative processing service."""
     
@@ -178,25 +146,25 @@ class TestCreativeProcessor:
         processor = CreativeProcessor(test_session)
         
         # Override viewability config for Phase 1
-        sample_runway_config.viewability_config = ViewabilityConfig(
-            phase=ViewabilityPhase.PHASE_1,
-            vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-            method="platform_native"
-        )
+        config = sample_runway_config.model_copy(update={
+            "viewability_config": PHASE1_DV_VIEWABILITY
+        })
         
-        result = await processor.process_creative(sample_runway_config)
+        result = await processor.process_creative(config)
         
         assert result.creative_id is not None
-        assert result.name == sample_runway_config.name
+        assert result.name == config.name
         assert result.format == CreativeFormat.RUNWAY
         assert result.amazon_dsp_ready is True
         assert result.creative_type == "CUSTOM_HTML"
         assert result.viewability_config.phase == ViewabilityPhase.PHASE_1
         
         # Check processed code contains expected elements
-        assert 'data-phase="phase_1"' in result.processed_code
-        assert "amazon-dsp-display-wrapper" in result.processed_code
-        assert "${AMAZON_CLICK_URL}" in result.processed_code
+        assert_contains_all(result.processed_code, (
+            'data-phase="phase_1"',
+            "amazon-dsp-display-wrapper",
+            "${AMAZON_CLICK_URL}",
+        ))
         
         # Check metadata
         assert result.processing_metadata.phase_applied == ViewabilityPhase.PHASE_1
@@ -209,48 +177,56 @@ class TestCreativeProcessor:
         processor = CreativeProcessor(test_session)
         
         # Override viewability config for Phase 2
-        sample_runway_config.viewability_config = ViewabilityConfig(
-            phase=ViewabilityPhase.PHASE_2,
-            vendors=[ViewabilityVendor.IAS, ViewabilityVendor.DOUBLE_VERIFY],
-            method="s2s_plus_native",
-            ias_s2s_enabled=True,
-            dsp_seat_id="KARGO_DSP_SEAT_001",
-            pub_id="kargo_test_pub"
-        )
+        config = sample_runway_config.model_copy(update={
+            "viewability_config": ViewabilityConfig(
+                phase=ViewabilityPhase.PHASE_2,
+                vendors=[ViewabilityVendor.IAS, ViewabilityVendor.DOUBLE_VERIFY],
+                method="s2s_plus_native",
+                ias_s2s_enabled=True,
+                dsp_seat_id="KARGO_DSP_SEAT_001",
+                pub_id="kargo_test_pub"
+            )
+        })
         
-        result = await processor.process_creative(sample_runway_config)
+        result = await processor.process_creative(config)
         
         assert result.viewability_config.phase == ViewabilityPhase.PHASE_2
         assert result.viewability_config.ias_s2s_enabled is True
         
         # Check processed code contains Phase 2 elements
-        assert 'data-phase="phase_2"' in result.processed_code
-        assert "ias-s2s-config" in result.processed_code
-        assert "KARGO_DSP_SEAT_001" in result.processed_code
-        assert "kargo_test_pub" in result.processed_code
+        assert_contains_all(result.processed_code, (
+            'data-phase="phase_2"',
+            "ias-s2s-config",
+            "KARGO_DSP_SEAT_001",
+            "kargo_test_pub",
+        ))
     
     async def test_process_video_phase1(self, test_session: AsyncSession, sample_video_config: CreativeConfig):
         """Test processing video creative in Phase 1."""
         processor = CreativeProcessor(test_session)
         
         # Override for Phase 1
-        sample_video_config.viewability_config = ViewabilityConfig(
-            phase=ViewabilityPhase.PHASE_1,
-            vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-            method="vast_wrapped"
-        )
+        config = sample_video_config.model_copy(update={
+            "viewability_config": ViewabilityConfig(
+                phase=ViewabilityPhase.PHASE_1,
+                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
+                method="vast_wrapped"
+            )
+        })
         
-        result = await processor.process_creative(sample_video_config)
+        result = await processor.process_creative(config)
         
         assert result.format == CreativeFormat.ENHANCED_PREROLL
         assert result.creative_type == "VAST_3_0"
         
         # Check VAST structure
-        assert '<?xml version="1.0" encoding="UTF-8"?>' in result.processed_code
-        assert '<VAST version="3.0">' in result.processed_code
-        assert "<Duration>00:00:15</Duration>" in result.processed_code
-        assert "doubleverify.com" in result.processed_code
-        assert "phase_1" in result.processed_code
+        assert_contains_all(result.processed_code, (
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            '<VAST version="3.0">',
+            "<Duration>00:00:15</Duration>",
+            "doubleverify.com",
+            "phase_1",
+        ))
     
     async def test_process_video_phase2(self, test_session: AsyncSession, sample_video_config: CreativeConfig):
         """Test processing video creative in Phase 2."""
@@ -262,91 +238,120 @@ class TestCreativeProcessor:
         assert result.viewability_config.phase == ViewabilityPhase.PHASE_2
         
         # Check Phase 2 VAST elements
-        assert "IAS_S2S" in result.processed_code
-        assert "DualVendorEnabled" in result.processed_code
-        assert sample_video_config.viewability_config.dsp_seat_id in result.processed_code
+        assert_contains_all(result.processed_code, (
+            "IAS_S2S",
+            "DualVendorEnabled",
+            sample_video_config.viewability_config.dsp_seat_id,
+        ))
     
-    async def test_get_processed_creative(self, test_session: AsyncSession, sample_runway_config: CreativeConfig):
-        """Test retrieving processed creative by ID."""
+    @pytest.mark.parametrize("action", ["get", "missing", "delete"])
+    async def test_processed_creative_crud(
+        self, test_session: AsyncSession, sample_runway_config: CreativeConfig, action: str
+    ):
+        """Test retrieving, missing-lookup and deleting against one processed creative."""
         processor = CreativeProcessor(test_session)
         
         # Process creative
         original = await processor.process_creative(sample_runway_config)
         
-        # Retrieve by ID
-        retrieved = await processor.get_processed_creative(original.creative_id)
-        
-        assert retrieved is not None
-        assert retrieved.creative_id == original.creative_id
-        assert retrieved.name == original.name
-        assert retrieved.processed_code == original.processed_code
-    
-    async def test_get_nonexistent_creative(self, test_session: AsyncSession):
-        """Test retrieving non-existent creative returns None."""
-        processor = CreativeProcessor(test_session)
-        
-        result = await processor.get_processed_creative("nonexistent-id")
-        assert result is None
+        if action == "get":
+            retrieved = await processor.get_processed_creative(original.creative_id)
+            
+            assert retrieved is not None
+            assert retrieved.creative_id == original.creative_id
+            assert retrieved.name == original.name
+            assert retrieved.processed_code == original.processed_code
+        
+        elif action == "missing":
+            result = await processor.get_processed_creative("nonexistent-id")
+            assert result is None
+        
+        else:
+            deleted = await processor.delete_processed_creative(original.creative_id)
+            assert deleted is True
+            
+            # Verify it's gone
+            retrieved = await processor.get_processed_creative(original.creative_id)
+            assert retrieved is None
+            
+            # Try to delete non-existent creative
+            deleted_again = await processor.delete_processed_creative(original.creative_id)
+            assert deleted_again is False
     
     async def test_list_processed_creatives(self, test_session: AsyncSession, sample_runway_config: CreativeConfig):
         """Test listing processed creatives."""
         processor = CreativeProcessor(test_session)
         
         # Process multiple creatives
-        config1 = sample_runway_config.copy()
-        config1.name = "Test Creative 1"
-        
-        config2 = sample_runway_config.copy()
-        config2.name = "Test Creative 2"
-        
-        await processor.process_creative(config1)
-        await processor.process_creative(config2)
+        config1 = sample_runway_config.model_copy(update={"name": "Test Creative 1"})
+        config2 = sample_runway_config.model_copy(update={"name": "Test Creative 2"})
+        
+        first = await processor.process_creative(config1)
+        second = await processor.process_creative(config2)
+        
+        # Pin distinct timestamps: utcnow can tie, and the creative_id tiebreak is random
+        for result, created_at in ((first, datetime(2024, 1, 1)), (second, datetime(2024, 1, 2))):
+            await test_session.execute(
+                update(ProcessedCreativeDB)
+                .where(ProcessedCreativeDB.creative_id == result.creative_id)
+                .values(created_at=created_at)
+            )
         
         # List creatives
-        creatives = await processor.list_processed_creatives(skip=0, limit=10)
+        creatives = await processor.list_processed_creative_rows(("name",), skip=0, limit=10)
         
-        assert len(creatives) == 2
         # Check they're ordered by creation date (most recent first)
-        assert creatives[0].name == "Test Creative 2"
-        assert creatives[1].name == "Test Creative 1"
+        assert creatives == [{"name": "Test Creative 2"}, {"name": "Test Creative 1"}]
     
-    async def test_delete_processed_creative(self, test_session: AsyncSession, sample_runway_config: CreativeConfig):
-        """Test deleting processed creative."""
+    async def test_list_processed_creative_rows_unknown_column(self, test_session: AsyncSession):
+        """Test projecting a column the table doesn't have is rejected."""
         processor = CreativeProcessor(test_session)
         
-        # Process creative
-        original = await processor.process_creative(sample_runway_config)
+        with pytest.raises(ValueError, match="Unknown creative columns: nope, bogus"):
+            await processor.list_processed_creative_rows(("name", "nope", "bogus"))
+    
+    async def test_list_processed_creatives_unknown_cursor(self, test_session: AsyncSession):
+        """Test keyset pagination from a creative_id that doesn't exist is rejected."""
+        processor = CreativeProcessor(test_session)
+        
+        with pytest.raises(ValueError, match="Unknown creative cursor: missing-id"):
+            await processor.list_processed_creatives(after="missing-id")
+    
+    async def test_process_creatives_isolates_store_failure(
+        self, test_session: AsyncSession, sample_runway_config: CreativeConfig
+    ):
+        """Test that one failed insert doesn't stop the rest of the batch from persisting."""
+        processor = CreativeProcessor(test_session)
+        configs = [
+            sample_runway_config.model_copy(update={"name": name})
+            for name in ("Batch 1", "Batch 2", "Batch 3")
+        ]
         
-        # Delete creative
-        deleted = await processor.delete_processed_creative(original.creative_id)
-        assert deleted is True
+        store = processor._store_processed_creative
+        stored_ids = []
         
-        # Verify it's gone
-        retrieved = await processor.get_processed_creative(original.creative_id)
-        assert retrieved is None
+        async def store_with_duplicate(creative, config):
+            # Reuse the first creative's primary key so the flush hits a real IntegrityError
+            if config.name == "Batch 2":
+                creative = creative.model_copy(update={"creative_id": stored_ids[0]})
+            await store(creative, config)
+            stored_ids.append(creative.creative_id)
         
-        # Try to delete non-existent creative
-        deleted_again = await processor.delete_processed_creative(original.creative_id)
-        assert deleted_again is False
+        processor._store_processed_creative = store_with_duplicate
+        
+        first, failed, third = await processor.process_creatives(configs)
+        await test_session.commit()
+        
+        assert isinstance(failed, IntegrityError)
+        listed = await processor.list_processed_creatives()
+        assert {creative.creative_id for creative in listed} == {first.creative_id, third.creative_id}
     
     async def test_invalid_snippet_url(self, test_session: AsyncSession):
         """Test processing with invalid snippet URL."""
         processor = CreativeProcessor(test_session)
         
-        config = CreativeConfig(
-            name="Invalid URL Test",
-            format=CreativeFormat.RUNWAY,
-            dimensions="320x50",
-            snippet_url="https://invalid-domain.com/snippet",
-            viewability_config=ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_1,
-                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                method="platform_native"
-            )
-        )
-        
         with pytest.raises(ValueError, match="Invalid snippet URL"):
-            await processor.process_creative(config)
+            await processor.process_creative(_INVALID_URL_CONFIG)
     
     async def test_processing_metadata_accuracy(self, test_session: AsyncSession, sample_kargo_snippet: str):
         """Test that processing metadata is accurate."""
@@ -357,11 +362,7 @@ class TestCreativeProcessor:
             format=CreativeFormat.RUNWAY,
             dimensions="320x50",
             snippet_url="https://snippet.kargo.com/snippet/dm/81298",  # Has IAS tags in mock
-            viewability_config=ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_1,
-                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                method="platform_native"
-            )
+            viewability_config=PHASE1_DV_VIEWABILITY
         )
         
         result = await processor.process_creative(config)
@@ -393,11 +394,7 @@ class TestCreativeProcessor:
             format=CreativeFormat.RUNWAY,
             dimensions="320x50",
             snippet_url="https://snippet.kargo.com/snippet/dm/81298",  # Mock has IAS tags
-            viewability_config=ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_1,  # Phase 1 but snippet has IAS
-                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                method="platform_native"
-            )
+            viewability_config=PHASE1_DV_VIEWABILITY  # Phase 1 but snippet has IAS
         )
         
         result = await processor.process_creative(config)
@@ -417,11 +414,7 @@ class TestCreativeProcessor:
             dimensions="320x50",
             snippet_url="https://snippet.kargo.com/snippet/dm/81298",
             device_type=DeviceType.MOBILE,
-            viewability_config=ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_1,
-                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                method="platform_native"
-            )
+            viewability_config=PHASE1_DV_VIEWABILITY
         )
         
         # Phase 2 Video creative
@@ -443,9 +436,8 @@ class TestCreativeProcessor:
             )
         )
         
-        # Process both creatives
-        runway_result = await processor.process_creative(runway_config)
-        video_result = await processor.process_creative(video_config)
+        # Process both creatives; fetch and transform overlap, storage stays serial
+        runway_result, video_result = await processor.process_creatives([runway_config, video_config])
         
         # Verify results
         assert runway_result.amazon_dsp_ready is True
@@ -453,7 +445,10 @@ class TestCreativeProcessor:
         
         # Verify they're stored in database
         all_creatives = await processor.list_processed_creatives()
-        assert len(all_creatives) == 2
+        assert {creative.creative_id for creative in all_creatives} == {
+            runway_result.creative_id,
+            video_result.creative_id,
+        }
         
         # Verify different processing approaches
         assert runway_result.viewability_config.phase == ViewabilityPhase.PHASE_1
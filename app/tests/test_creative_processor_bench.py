@@ -0,0 +1,40 @@
+"""Micro-benchmarks for the snippet transformer hot path.
+
+Skipped unless ``BENCH`` is set in the environment, so the default test run
+stays fast. Run with ``BENCH=1 pytest app/tests/test_creative_processor_bench.py``.
+"""
+import os
+
+import pytest
+
+from app.services.creative_processor import SnippetTransformer
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.skipif(not os.getenv("BENCH"), reason="benchmarks only run with BENCH set")
+
+
+def test_bench_remove_ias_tags(benchmark, sample_kargo_snippet: str):
+    """Benchmark IAS tag stripping on a snippet that carries an IAS pixel."""
+    cleaned_code, removed_tags = benchmark(SnippetTransformer.remove_ias_tags, sample_kargo_snippet)
+
+    assert removed_tags
+    assert "adsafeprotected" not in cleaned_code
+
+
+def test_bench_wrap_display_html5_phase2(benchmark, config_catalog, sample_kargo_snippet: str):
+    """Benchmark the Phase 2 display wrapper."""
+    config = config_catalog["display_phase2"]
+
+    wrapped = benchmark(SnippetTransformer.wrap_display_html5_phase2, sample_kargo_snippet, config)
+
+    assert 'data-phase="phase_2"' in wrapped
+
+
+def test_bench_wrap_vast_phase2(benchmark, config_catalog):
+    """Benchmark the Phase 2 VAST wrapper."""
+    config = config_catalog["vast_phase2"]
+
+    wrapped = benchmark(SnippetTransformer.wrap_vast_phase2, "", config)
+
+    assert "IAS_S2S" in wrapped
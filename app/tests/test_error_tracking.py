@@ -0,0 +1,229 @@
+"""Tests for error tracking, aggregation and alerting."""
+import asyncio
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.utils import error_tracking as error_tracking_module
+from app.utils.error_tracking import (
+    ErrorAggregator,
+    ErrorCategory,
+    ErrorEvent,
+    ErrorSeverity,
+    ErrorTracker,
+    _exception_fingerprint,
+)
+from app.utils.metrics import REGISTRY
+
+
+def _raise(exception: Exception) -> None:
+    raise exception
+
+
+def _caught(exception: Exception) -> Exception:
+    """Raise and catch an exception, always from the same frames."""
+    try:
+        _raise(exception)
+    except Exception as e:
+        return e
+
+
+def _event(fingerprint_seed: str = "x") -> ErrorEvent:
+    return ErrorEvent(
+        id=fingerprint_seed,
+        timestamp=datetime.utcnow(),
+        severity=ErrorSeverity.MEDIUM,
+        category=ErrorCategory.INTERNAL_ERROR,
+        message=fingerprint_seed,
+        exception_type="ValueError",
+    )
+
+
+class TestErrorAggregation:
+    """Test grouping of repeated errors."""
+    
+    def test_severity_escalates_by_rank(self):
+        """Test a CRITICAL repeat of a HIGH error escalates it and a LOW repeat doesn't lower it."""
+        tracker = ErrorTracker()
+        
+        for severity in (ErrorSeverity.HIGH, ErrorSeverity.CRITICAL, ErrorSeverity.LOW):
+            event = tracker.track_error(_caught(ValueError("boom")), severity=severity)
+        
+        assert event.count == 3
+        assert event.severity == ErrorSeverity.CRITICAL
+    
+    def test_exception_fingerprint_matches_event(self):
+        """Test the pre-build fingerprint equals the one the stored event computes."""
+        tracker = ErrorTracker()
+        exception = _caught(KeyError("missing"))
+        
+        event = tracker.track_error(
+            exception, category=ErrorCategory.DATABASE_ERROR, component="db"
+        )
+        
+        assert event.fingerprint() == _exception_fingerprint(
+            exception, ErrorCategory.DATABASE_ERROR, "db"
+        )
+        assert len(event.fingerprint()) == 16
+    
+    def test_stale_errors_cleaned_per_shard(self):
+        """Test a full shard drops only its expired entries."""
+        aggregator = ErrorAggregator(max_size=ErrorAggregator.SHARDS, time_window=60)
+        stale, fresh, other_shard = _event("stale"), _event("fresh"), _event("other")
+        
+        # First byte picks the shard: 0x00 and 0x10 share shard 0, 0x01 is shard 1
+        aggregator.add_error(stale, b"\x00" * 16)
+        aggregator.add_error(other_shard, b"\x01" * 16)
+        stale._last_seen_mono = time.monotonic() - 120
+        
+        aggregator.add_error(fresh, b"\x10" * 16)
+        
+        assert {event["id"] for event in aggregator.get_error_summary()} == {"fresh", "other"}
+    
+    def test_summary_reflects_updates(self):
+        """Test the cached summary entry is refreshed when an error repeats."""
+        aggregator = ErrorAggregator()
+        event = _event()
+        aggregator.add_error(event)
+        assert aggregator.get_error_summary()[0]["count"] == 1
+        
+        aggregator.add_error(_event())
+        
+        assert aggregator.get_error_summary()[0]["count"] == 2
+    
+    def test_summary_not_corrupted_by_callers(self):
+        """Test mutating a returned summary entry leaves the cached copy intact."""
+        aggregator = ErrorAggregator()
+        aggregator.add_error(_event())
+        
+        aggregator.get_error_summary()[0]["count"] = 99
+        
+        assert aggregator.get_error_summary()[0]["count"] == 1
+
+
+class TestErrorStatistics:
+    """Test per-minute occurrence statistics."""
+    
+    def test_hour_and_day_windows(self, monkeypatch):
+        """Test errors are split between the last hour and the last 24 hours."""
+        now = [1_700_000_000.0]
+        # Pin the module's wall clock only; monotonic time stays real
+        monkeypatch.setattr(
+            error_tracking_module,
+            "time",
+            SimpleNamespace(time=lambda: now[0], monotonic=time.monotonic),
+        )
+        tracker = ErrorTracker()
+        
+        for _ in range(2):
+            tracker.track_error(_caught(ValueError("old")), category=ErrorCategory.API_ERROR)
+        now[0] += 2 * 3600
+        for _ in range(3):
+            tracker.track_error(
+                _caught(ValueError("new")),
+                severity=ErrorSeverity.HIGH,
+                category=ErrorCategory.DATABASE_ERROR,
+            )
+        
+        stats = tracker.get_error_statistics()
+        
+        assert stats["errors_last_hour"] == 3
+        assert stats["errors_last_24h"] == 5
+        assert stats["category_breakdown"] == {"api_error": 2, "database_error": 3}
+        assert stats["severity_breakdown"] == {"medium": 2, "high": 3}
+        assert stats["unique_errors"] == 2
+
+
+class TestErrorMetrics:
+    """Test buffering of the Prometheus error counter."""
+    
+    @staticmethod
+    def _count(component: str, severity: str) -> float:
+        return REGISTRY.get_sample_value(
+            "errors_total",
+            {"component": component, "error_type": "ValueError", "severity": severity},
+        ) or 0.0
+    
+    async def test_buffered_until_flush(self):
+        """Test non-critical errors reach the counter in one batch on flush."""
+        tracker = ErrorTracker()
+        
+        for _ in range(4):
+            tracker.track_error(_caught(ValueError("x")), component="buffered")
+        assert self._count("buffered", "medium") == 0.0
+        
+        assert tracker.flush_error_metrics() == 1
+        
+        assert self._count("buffered", "medium") == 4.0
+        await tracker.shutdown()
+    
+    async def test_shutdown_flushes_and_stops_tasks(self):
+        """Test shutdown pushes pending counts and leaves no background task running."""
+        tracker = ErrorTracker()
+        tracker.add_alert_handler(lambda alert_data: None)
+        tracker.track_error(_caught(ValueError("x")), component="shutdown")
+        tracker.track_error(_caught(ValueError("x")), severity=ErrorSeverity.CRITICAL)
+        tasks = (tracker._metrics_flush_task, tracker._alert_worker_task)
+        
+        await tracker.shutdown()
+        
+        assert self._count("shutdown", "medium") == 1.0
+        assert all(task.done() for task in tasks)
+    
+    async def test_critical_recorded_immediately(self):
+        """Test critical errors skip the buffer."""
+        tracker = ErrorTracker()
+        
+        tracker.track_error(
+            _caught(ValueError("x")), severity=ErrorSeverity.CRITICAL, component="unbuffered"
+        )
+        
+        assert self._count("unbuffered", "critical") == 1.0
+
+
+class TestAlertDispatch:
+    """Test the alert handler queue."""
+    
+    async def test_handlers_run_on_worker(self):
+        """Test each handler receives the alert and a failing handler doesn't block the others."""
+        tracker = ErrorTracker()
+        received = asyncio.Queue()
+        
+        def failing_handler(alert_data):
+            raise RuntimeError("handler bug")
+        
+        async def recording_handler(alert_data):
+            await received.put(alert_data)
+        
+        tracker.add_alert_handler(failing_handler)
+        tracker.add_alert_handler(recording_handler)
+        
+        tracker.track_error(_caught(ValueError("x")), severity=ErrorSeverity.CRITICAL)
+        alert = await asyncio.wait_for(received.get(), timeout=1)
+        
+        assert alert["rule_name"] == "critical_errors"
+        assert alert["error"]["severity"] == ErrorSeverity.CRITICAL
+        await tracker.shutdown()
+    
+    def test_alert_outside_loop_is_dropped(self):
+        """Test alerts raised with no running loop are not queued."""
+        tracker = ErrorTracker()
+        tracker.add_alert_handler(lambda alert_data: None)
+        
+        tracker.track_error(_caught(ValueError("x")), severity=ErrorSeverity.CRITICAL)
+        
+        assert not tracker._alert_queue
+
+
+@pytest.mark.parametrize("severity", list(ErrorSeverity))
+def test_min_severity_filter(severity: ErrorSeverity):
+    """Test the database_errors rule only considers HIGH and CRITICAL errors."""
+    tracker = ErrorTracker()
+    rule = next(rule for rule in tracker.alert_rules if rule.name == "database_errors")
+    event = _event()
+    event.category = ErrorCategory.DATABASE_ERROR
+    event.severity = severity
+    
+    assert rule.should_trigger(event) is (severity in (ErrorSeverity.HIGH, ErrorSeverity.CRITICAL))
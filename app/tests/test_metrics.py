@@ -0,0 +1,58 @@
+"""Tests for Prometheus metrics collection."""
+from prometheus_client import generate_latest
+
+from app.utils.metrics import REGISTRY, MetricsCollector, TimingContext
+
+
+class TestMetricsCollector:
+    """Test metric recording helpers."""
+    
+    def test_http_requests_visible_to_exporter(self):
+        """Test every recorded request shows up in the next scrape, with no flush step."""
+        for status_code in (200, 201, 200, 404, 500):
+            MetricsCollector.record_http_request("GET", "/test/exporter", status_code, 0.01)
+        
+        exposition = generate_latest(REGISTRY).decode()
+        
+        assert 'http_requests_total{endpoint="/test/exporter",method="GET",status_class="2xx"} 3.0' in exposition
+        assert 'http_requests_total{endpoint="/test/exporter",method="GET",status_class="4xx"} 1.0' in exposition
+        assert 'http_requests_total{endpoint="/test/exporter",method="GET",status_class="5xx"} 1.0' in exposition
+        assert 'http_request_duration_seconds_count{endpoint="/test/exporter",method="GET"} 5.0' in exposition
+    
+    def test_kargo_requests_share_cached_child(self):
+        """Test repeated label sets accumulate on one series."""
+        for _ in range(3):
+            MetricsCollector.record_kargo_request("/test/cached", 200, 0.02)
+        
+        assert REGISTRY.get_sample_value(
+            "kargo_api_requests_total", {"endpoint": "/test/cached", "status_code": "200"}
+        ) == 3.0
+        assert REGISTRY.get_sample_value(
+            "kargo_api_request_duration_seconds_count", {"endpoint": "/test/cached"}
+        ) == 3.0
+
+
+class TestTimingContext:
+    """Test the timing context manager."""
+    
+    def test_reports_duration_and_status(self):
+        """Test the duration is non-negative seconds and errors are flagged."""
+        calls = []
+        
+        def record(*args, duration, status):
+            calls.append((args, duration, status))
+        
+        with TimingContext(record, "op"):
+            pass
+        
+        try:
+            with TimingContext(record, "op"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        
+        (args, duration, status), (_, _, error_status) = calls
+        assert args == ("op",)
+        assert 0 <= duration < 1
+        assert status == "success"
+        assert error_status == "error"
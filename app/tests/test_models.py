@@ -1,7 +1,8 @@
 """Tests for Pydantic models."""
 import pytest
 from datetime import date, timedelta
-from pydantic import ValidationError
+from typing import List
+from pydantic import TypeAdapter, ValidationError
 
 from app.models.creative import (
     CreativeConfig, 
@@ -20,6 +21,43 @@ from app.models.campaign import (
     GoalKPI,
     EXAMPLE_CAMPAIGN_CONFIG
 )
+from app.tests.helpers import PHASE1_DV_VIEWABILITY
+
+
+# Built once so the list validator is not recompiled per test
+_CREATIVE_LIST_ADAPTER = TypeAdapter(List[CreativeConfig])
+
+# Valid flight window shared by the campaign tests
+_START_DATE = date.today() + timedelta(days=1)
+_END_DATE = date.today() + timedelta(days=31)
+
+
+def _make_creative(**overrides) -> CreativeConfig:
+    """Build a runway creative for campaign tests without re-running creative validation."""
+    fields = {
+        "name": "Runway Creative",
+        "format": CreativeFormat.RUNWAY,
+        "dimensions": "320x50",
+        "snippet_url": "https://snippet.kargo.com/snippet/dm/12345",
+        "viewability_config": PHASE1_DV_VIEWABILITY,
+    }
+    fields.update(overrides)
+    return CreativeConfig.model_construct(**fields)
+
+
+def _campaign(**overrides) -> CampaignConfig:
+    """Build a Phase 1 campaign, overriding the fields under test."""
+    fields = {
+        "name": "Test Campaign",
+        "advertiser_id": "123456",
+        "total_budget": 10000.0,
+        "start_date": _START_DATE,
+        "end_date": _END_DATE,
+        "phase": CampaignPhase.PHASE_1,
+        "viewability_config": PHASE1_DV_VIEWABILITY,
+    }
+    fields.update(overrides)
+    return CampaignConfig(**fields)
 
 
 class TestCreativeModels:
@@ -33,11 +71,7 @@ class TestCreativeModels:
             dimensions="320x50",
             snippet_url="https://snippet.kargo.com/snippet/dm/12345",
             device_type=DeviceType.MOBILE,
-            viewability_config=ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_1,
-                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                method="platform_native"
-            )
+            viewability_config=PHASE1_DV_VIEWABILITY
         )
         
         assert config.name == "Test Creative"
@@ -45,22 +79,45 @@ class TestCreativeModels:
         assert config.dimensions == "320x50"
         assert config.device_type == DeviceType.MOBILE
     
-    def test_creative_config_invalid_dimensions(self):
-        """Test creative configuration with invalid dimensions."""
-        with pytest.raises(ValidationError) as exc_info:
-            CreativeConfig(
-                name="Test Creative",
-                format=CreativeFormat.RUNWAY,
-                dimensions="invalid",
-                snippet_url="https://snippet.kargo.com/snippet/dm/12345",
-                viewability_config=ViewabilityConfig(
-                    phase=ViewabilityPhase.PHASE_1,
-                    vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                    method="platform_native"
-                )
-            )
+    def test_creative_configs_bulk_valid(self):
+        """Test a batch of raw creative payloads validates in one pass."""
+        payloads = [
+            {
+                "name": "Runway Creative",
+                "format": "runway",
+                "dimensions": "320x50",
+                "snippet_url": "https://snippet.kargo.com/snippet/dm/81298",
+                "viewability_config": {
+                    "phase": "phase_1",
+                    "vendors": ["double_verify"],
+                    "method": "platform_native",
+                },
+            },
+            {
+                "name": "Video Creative",
+                "format": "enhanced_preroll",
+                "dimensions": "300x50",
+                "snippet_url": "https://snippet.kargo.com/snippet/dm/81172",
+                "duration": 15,
+                "branded_canvas": True,
+                "viewability_config": {
+                    "phase": "phase_2",
+                    "vendors": ["ias", "double_verify"],
+                    "method": "s2s_plus_wrapped",
+                    "ias_s2s_enabled": True,
+                    "dsp_seat_id": "KARGO_DSP_SEAT_001",
+                    "pub_id": "kargo_test_pub",
+                },
+            },
+        ]
+        
+        configs = _CREATIVE_LIST_ADAPTER.validate_python(payloads)
         
-        assert "Dimensions must be in format" in str(exc_info.value)
+        assert [config.format for config in configs] == [
+            CreativeFormat.RUNWAY,
+            CreativeFormat.ENHANCED_PREROLL,
+        ]
+        assert configs[1].viewability_config.phase == ViewabilityPhase.PHASE_2
     
     def test_viewability_config_phase_1(self):
         """Test Phase 1 viewability configuration."""
@@ -75,17 +132,6 @@ class TestCreativeModels:
         assert config.ias_removed is True
         assert config.ias_s2s_enabled is False
     
-    def test_viewability_config_phase_1_with_ias_error(self):
-        """Test Phase 1 configuration with IAS should raise error."""
-        with pytest.raises(ValidationError) as exc_info:
-            ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_1,
-                vendors=[ViewabilityVendor.IAS, ViewabilityVendor.DOUBLE_VERIFY],
-                method="platform_native"
-            )
-        
-        assert "Phase 1 should not include IAS" in str(exc_info.value)
-    
     def test_viewability_config_phase_2(self):
         """Test Phase 2 viewability configuration."""
         config = ViewabilityConfig(
@@ -103,17 +149,6 @@ class TestCreativeModels:
         assert ViewabilityVendor.IAS in config.vendors
         assert ViewabilityVendor.DOUBLE_VERIFY in config.vendors
     
-    def test_viewability_config_phase_2_insufficient_vendors(self):
-        """Test Phase 2 configuration with insufficient vendors."""
-        with pytest.raises(ValidationError) as exc_info:
-            ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_2,
-                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                method="s2s_plus_wrapped"
-            )
-        
-        assert "Phase 2 should include both IAS and DV vendors" in str(exc_info.value)
-    
     def test_processing_metadata(self):
         """Test processing metadata model."""
         metadata = ProcessingMetadata(
@@ -144,146 +179,106 @@ class TestCampaignModels:
     
     def test_campaign_config_valid(self):
         """Test valid campaign configuration."""
-        start_date = date.today() + timedelta(days=1)
-        end_date = date.today() + timedelta(days=31)
-        
         config = CampaignConfig(
             name="Test Campaign",
             advertiser_id="123456",
             goal_kpi=GoalKPI.VIEWABILITY,
             total_budget=10000.0,
-            start_date=start_date,
-            end_date=end_date,
+            start_date=_START_DATE,
+            end_date=_END_DATE,
             phase=CampaignPhase.PHASE_1,
-            viewability_config=ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_1,
-                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                method="platform_native"
-            )
+            viewability_config=PHASE1_DV_VIEWABILITY
         )
         
         assert config.name == "Test Campaign"
         assert config.total_budget == 10000.0
         assert config.phase == CampaignPhase.PHASE_1
     
-    def test_campaign_config_invalid_dates(self):
-        """Test campaign configuration with invalid dates."""
-        start_date = date.today() + timedelta(days=10)
-        end_date = date.today() + timedelta(days=5)  # Before start date
-        
-        with pytest.raises(ValidationError) as exc_info:
-            CampaignConfig(
-                name="Test Campaign",
-                advertiser_id="123456",
-                total_budget=10000.0,
-                start_date=start_date,
-                end_date=end_date,
-                phase=CampaignPhase.PHASE_1,
-                viewability_config=ViewabilityConfig(
-                    phase=ViewabilityPhase.PHASE_1,
-                    vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                    method="platform_native"
-                )
-            )
-        
-        assert "End date must be after start date" in str(exc_info.value)
-    
-    def test_campaign_config_negative_budget(self):
-        """Test campaign configuration with negative budget."""
-        start_date = date.today() + timedelta(days=1)
-        end_date = date.today() + timedelta(days=31)
-        
-        with pytest.raises(ValidationError) as exc_info:
-            CampaignConfig(
-                name="Test Campaign",
-                advertiser_id="123456",
-                total_budget=-1000.0,  # Negative budget
-                start_date=start_date,
-                end_date=end_date,
-                phase=CampaignPhase.PHASE_1,
-                viewability_config=ViewabilityConfig(
-                    phase=ViewabilityPhase.PHASE_1,
-                    vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                    method="platform_native"
-                )
-            )
-        
-        assert "greater than 0" in str(exc_info.value)
-    
     def test_campaign_config_with_creatives(self):
         """Test campaign configuration with creative lists."""
-        start_date = date.today() + timedelta(days=1)
-        end_date = date.today() + timedelta(days=31)
-        
-        runway_creative = CreativeConfig(
-            name="Runway Creative",
-            format=CreativeFormat.RUNWAY,
-            dimensions="320x50",
-            snippet_url="https://snippet.kargo.com/snippet/dm/12345",
-            viewability_config=ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_1,
-                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                method="platform_native"
-            )
-        )
+        runway_creative = _make_creative()
         
         config = CampaignConfig(
             name="Test Campaign",
             advertiser_id="123456",
             total_budget=10000.0,
-            start_date=start_date,
-            end_date=end_date,
+            start_date=_START_DATE,
+            end_date=_END_DATE,
             phase=CampaignPhase.PHASE_1,
-            viewability_config=ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_1,
-                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                method="platform_native"
-            ),
+            viewability_config=PHASE1_DV_VIEWABILITY,
             runway_creatives=[runway_creative]
         )
         
         assert len(config.runway_creatives) == 1
         assert config.runway_creatives[0].name == "Runway Creative"
     
-    def test_campaign_config_invalid_creative(self):
-        """Test campaign configuration with invalid creative."""
-        start_date = date.today() + timedelta(days=1)
-        end_date = date.today() + timedelta(days=31)
-        
-        # Creative with missing name
-        invalid_creative = CreativeConfig(
-            name="",  # Empty name
-            format=CreativeFormat.RUNWAY,
-            dimensions="320x50",
-            snippet_url="https://snippet.kargo.com/snippet/dm/12345",
-            viewability_config=ViewabilityConfig(
-                phase=ViewabilityPhase.PHASE_1,
-                vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                method="platform_native"
-            )
-        )
-        
-        with pytest.raises(ValidationError) as exc_info:
-            CampaignConfig(
-                name="Test Campaign",
-                advertiser_id="123456",
-                total_budget=10000.0,
-                start_date=start_date,
-                end_date=end_date,
-                phase=CampaignPhase.PHASE_1,
-                viewability_config=ViewabilityConfig(
-                    phase=ViewabilityPhase.PHASE_1,
-                    vendors=[ViewabilityVendor.DOUBLE_VERIFY],
-                    method="platform_native"
-                ),
-                runway_creatives=[invalid_creative]
-            )
-        
-        assert "All creatives must have name and snippet_url" in str(exc_info.value)
-    
     def test_example_campaign_config(self):
         """Test example campaign configuration is valid."""
         # Should not raise validation errors
         assert EXAMPLE_CAMPAIGN_CONFIG.name == "RMI_Q3_2025_HighImpact_Phase1"
         assert EXAMPLE_CAMPAIGN_CONFIG.phase == CampaignPhase.PHASE_1
-        assert len(EXAMPLE_CAMPAIGN_CONFIG.runway_creatives) > 0
\ No newline at end of file
+        assert len(EXAMPLE_CAMPAIGN_CONFIG.runway_creatives) > 0
+
+class TestModelValidationErrors:
+    """Test that invalid model input is rejected with a useful message."""
+    
+    @pytest.mark.parametrize(
+        "build,message",
+        [
+            (
+                lambda: CreativeConfig(
+                    name="Test Creative",
+                    format=CreativeFormat.RUNWAY,
+                    dimensions="invalid",
+                    snippet_url="https://snippet.kargo.com/snippet/dm/12345",
+                    viewability_config=PHASE1_DV_VIEWABILITY
+                ),
+                "Dimensions must be in format",
+            ),
+            (
+                lambda: ViewabilityConfig(
+                    phase=ViewabilityPhase.PHASE_1,
+                    vendors=[ViewabilityVendor.IAS, ViewabilityVendor.DOUBLE_VERIFY],
+                    method="platform_native"
+                ),
+                "Phase 1 should not include IAS",
+            ),
+            (
+                lambda: ViewabilityConfig(
+                    phase=ViewabilityPhase.PHASE_2,
+                    vendors=[ViewabilityVendor.DOUBLE_VERIFY],
+                    method="s2s_plus_wrapped"
+                ),
+                "Phase 2 should include both IAS and DV vendors",
+            ),
+            (
+                lambda: _campaign(
+                    start_date=date.today() + timedelta(days=10),
+                    end_date=date.today() + timedelta(days=5),  # Before start date
+                ),
+                "End date must be after start date",
+            ),
+            (
+                lambda: _campaign(total_budget=-1000.0),
+                "greater than 0",
+            ),
+            (
+                lambda: _campaign(runway_creatives=[_make_creative(name="")]),  # Empty name
+                "All creatives must have name and snippet_url",
+            ),
+        ],
+        ids=[
+            "creative_invalid_dimensions",
+            "viewability_phase_1_with_ias",
+            "viewability_phase_2_insufficient_vendors",
+            "campaign_invalid_dates",
+            "campaign_negative_budget",
+            "campaign_invalid_creative",
+        ],
+    )
+    def test_validation_error(self, build, message: str):
+        """Test each invalid configuration raises ValidationError with its message."""
+        with pytest.raises(ValidationError) as exc_info:
+            build()
+        
+        assert message in str(exc_info.value)
@@ -1,19 +1,25 @@
 """Error tracking and alerting system."""
 import asyncio
+import hashlib
 import json
+import logging
 import traceback
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
-from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from dataclasses import dataclass, field, fields
+from collections import Counter, deque
 import threading
+import time
 from contextlib import contextmanager
+from itertools import islice
 
-from app.utils.logging import get_logger, get_correlation_id
+from app.utils.logging import generate_id, get_logger, get_correlation_id
 from app.utils.metrics import MetricsCollector
 
 logger = get_logger(__name__)
+# Underlying stdlib logger, for cheap level checks before building log records
+_stdlib_logger = logging.getLogger(__name__)
 
 
 class ErrorSeverity(str, Enum):
@@ -24,6 +30,15 @@ class ErrorSeverity(str, Enum):
     CRITICAL = "critical"
 
 
+# Numeric order of severities, for "at least this severe" comparisons
+SEVERITY_RANK: Dict[ErrorSeverity, int] = {
+    ErrorSeverity.LOW: 0,
+    ErrorSeverity.MEDIUM: 1,
+    ErrorSeverity.HIGH: 2,
+    ErrorSeverity.CRITICAL: 3,
+}
+
+
 class ErrorCategory(str, Enum):
     """Error categories for classification."""
     API_ERROR = "api_error"
@@ -40,7 +55,7 @@ class ErrorCategory(str, Enum):
     USER_ERROR = "user_error"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorEvent:
     """Represents an error event for tracking and alerting."""
     id: str
@@ -49,7 +64,8 @@ class ErrorEvent:
     category: ErrorCategory
     message: str
     exception_type: str
-    stack_trace: str
+    # Captured without source lines; formatted only when stack_trace is read
+    tb_exception: Optional[traceback.TracebackException] = field(default=None, repr=False, compare=False)
     correlation_id: Optional[str] = None
     user_id: Optional[str] = None
     request_id: Optional[str] = None
@@ -60,125 +76,306 @@ class ErrorEvent:
     count: int = 1
     first_seen: Optional[datetime] = None
     last_seen: Optional[datetime] = None
+    _fingerprint: bytes = field(default=b"", init=False, repr=False, compare=False)
+    _stack_trace: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    # Monotonic twin of last_seen, used for age checks
+    _last_seen_mono: float = field(default_factory=time.monotonic, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.first_seen is None:
             self.first_seen = self.timestamp
         if self.last_seen is None:
             self.last_seen = self.timestamp
+        
+        # Outermost few frames for similarity
+        frames = (
+            ((frame.filename, frame.lineno) for frame in self.tb_exception.stack[:5])
+            if self.tb_exception is not None
+            else ()
+        )
+        self._fingerprint = _fingerprint_digest(
+            self.exception_type, self.category, self.component, frames
+        )
+    
+    @property
+    def stack_trace(self) -> str:
+        """Formatted traceback, built on first access."""
+        if self._stack_trace is None:
+            self._stack_trace = (
+                "".join(self.tb_exception.format()) if self.tb_exception is not None else ""
+            )
+        return self._stack_trace
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        data = asdict(self)
-        # Convert datetime objects to ISO strings
-        for key, value in data.items():
-            if isinstance(value, datetime):
-                data[key] = value.isoformat()
-        return data
-    
-    def fingerprint(self) -> str:
-        """Generate a unique fingerprint for grouping similar errors."""
-        components = [
-            self.exception_type,
-            self.category.value,
-            self.component or "unknown",
-            # First few lines of stack trace for similarity
-            "\n".join(self.stack_trace.split("\n")[:5]),
-        ]
-        return hash(tuple(components))
+        """Convert to dictionary for serialization.
+        
+        The serialized fields are cached until ``invalidate()`` is called; each
+        call returns a fresh shallow copy, so callers (alert handlers included)
+        may modify it freely. ``context`` is shared by reference.
+        """
+        data = self._cached_dict
+        if data is None:
+            data = {
+                name: (
+                    value.isoformat()
+                    if name in _DATETIME_FIELDS and value is not None
+                    else value
+                )
+                for name in _SERIALIZED_FIELDS
+                for value in (getattr(self, name),)
+            }
+            self._cached_dict = data
+        return dict(data)
+    
+    def invalidate(self) -> None:
+        """Drop the cached ``to_dict`` output after a mutable field changes."""
+        self._cached_dict = None
+    
+    def fingerprint(self) -> bytes:
+        """Return the fingerprint used to group similar errors.
+        
+        A 16-byte blake2b digest, stable across processes.
+        """
+        return self._fingerprint
+
+
+_SERIALIZED_FIELDS = tuple(
+    "stack_trace" if f.name == "tb_exception" else f.name
+    for f in fields(ErrorEvent)
+    if not f.name.startswith("_")
+)
+_DATETIME_FIELDS = frozenset({"timestamp", "first_seen", "last_seen"})
+
+
+def _fingerprint_digest(
+    exception_type: str,
+    category: ErrorCategory,
+    component: Optional[str],
+    frames: Iterable[Tuple[str, Optional[int]]],
+) -> bytes:
+    """Hash the parts that identify "the same" error into a 16-byte blake2b digest."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(exception_type.encode())
+    digest.update(b"|")
+    digest.update(category.value.encode())
+    digest.update(b"|")
+    digest.update((component or "unknown").encode())
+    for filename, lineno in frames:
+        digest.update(f"|{filename}:{lineno}".encode())
+    return digest.digest()
+
+
+def _exception_fingerprint(
+    exception: Exception, category: ErrorCategory, component: Optional[str]
+) -> bytes:
+    """Fingerprint an exception from its type and outermost frames, without formatting the stack.
+    
+    Matches ``ErrorEvent.fingerprint()`` for an event built from the same exception.
+    """
+    frames = (
+        (frame.f_code.co_filename, lineno)
+        for frame, lineno in islice(traceback.walk_tb(exception.__traceback__), 5)
+    )
+    return _fingerprint_digest(exception.__class__.__name__, category, component, frames)
 
 
 class ErrorAggregator:
-    """Aggregates similar errors to reduce noise."""
+    """Aggregates similar errors to reduce noise.
+    
+    Events are spread over ``SHARDS`` dicts keyed by fingerprint, each with its
+    own lock, so concurrent tracking of unrelated errors doesn't serialise.
+    """
+    
+    SHARDS = 16
     
     def __init__(self, max_size: int = 1000, time_window: int = 300):
         self.max_size = max_size
         self.time_window = timedelta(seconds=time_window)
-        self.errors: Dict[str, ErrorEvent] = {}
-        self._lock = threading.RLock()
+        self._time_window_seconds = float(time_window)
+        self._shard_max_size = max(1, max_size // self.SHARDS)
+        self._shards: List[Dict[bytes, ErrorEvent]] = [{} for _ in range(self.SHARDS)]
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(self.SHARDS)]
+    
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
     
-    def add_error(self, error: ErrorEvent) -> ErrorEvent:
+    def bump(
+        self, fingerprint: bytes, timestamp: datetime, severity: ErrorSeverity
+    ) -> Optional[ErrorEvent]:
+        """Count another occurrence of a known error.
+        
+        Returns the updated event, or None if the fingerprint is new and a full
+        event has to be built and passed to ``add_error``.
+        """
+        index = fingerprint[0] & (self.SHARDS - 1)
+        with self._locks[index]:
+            existing = self._shards[index].get(fingerprint)
+            if existing is None:
+                return None
+            existing.count += 1
+            existing.last_seen = timestamp
+            existing._last_seen_mono = time.monotonic()
+            # Keep the most severe level
+            if SEVERITY_RANK[severity] > SEVERITY_RANK[existing.severity]:
+                existing.severity = severity
+            existing.invalidate()
+            return existing
+    
+    def add_error(self, error: ErrorEvent, fingerprint: Optional[bytes] = None) -> ErrorEvent:
         """Add an error event, aggregating with existing similar errors."""
-        fingerprint = str(error.fingerprint())
+        if fingerprint is None:
+            fingerprint = error.fingerprint()
         
-        with self._lock:
-            if fingerprint in self.errors:
-                existing = self.errors[fingerprint]
+        index = fingerprint[0] & (self.SHARDS - 1)
+        shard = self._shards[index]
+        with self._locks[index]:
+            if fingerprint in shard:
+                existing = shard[fingerprint]
                 # Update existing error
                 existing.count += 1
                 existing.last_seen = error.timestamp
+                existing._last_seen_mono = time.monotonic()
                 # Keep the most severe level
-                if error.severity.value > existing.severity.value:
+                if SEVERITY_RANK[error.severity] > SEVERITY_RANK[existing.severity]:
                     existing.severity = error.severity
+                existing.invalidate()
                 return existing
             else:
-                # Clean old errors if we're at capacity
-                if len(self.errors) >= self.max_size:
-                    self._cleanup_old_errors()
+                # Clean old errors if this shard is at capacity
+                if len(shard) >= self._shard_max_size:
+                    self._cleanup_old_errors(shard)
                 
-                self.errors[fingerprint] = error
+                shard[fingerprint] = error
                 return error
     
-    def _cleanup_old_errors(self):
-        """Remove errors older than the time window."""
-        cutoff = datetime.utcnow() - self.time_window
+    def _cleanup_old_errors(self, shard: Dict[bytes, ErrorEvent]) -> None:
+        """Remove errors older than the time window from one shard.
+        
+        Caller must hold the shard's lock.
+        """
+        cutoff = time.monotonic() - self._time_window_seconds
         to_remove = [
-            fp for fp, error in self.errors.items()
-            if error.last_seen < cutoff
+            fp for fp, error in shard.items()
+            if error._last_seen_mono < cutoff
         ]
         for fp in to_remove:
-            del self.errors[fp]
+            del shard[fp]
     
     def get_error_summary(self) -> List[Dict[str, Any]]:
-        """Get summary of current errors."""
-        with self._lock:
-            return [error.to_dict() for error in self.errors.values()]
+        """Get summary of current errors.
+        
+        Shards are read one at a time, so counts may be slightly stale.
+        """
+        summary: List[Dict[str, Any]] = []
+        for shard in self._shards:
+            summary.extend(error.to_dict() for error in list(shard.values()))
+        return summary
+
+
+@dataclass(slots=True)
+class _MinuteBucket:
+    """Error occurrences tracked within one wall-clock minute.
+    
+    The counters are keyed by enum member; names are only produced when
+    statistics are reported.
+    """
+    minute: int
+    count: int = 0
+    categories: Counter[ErrorCategory] = field(default_factory=Counter)
+    severities: Counter[ErrorSeverity] = field(default_factory=Counter)
 
 
 class AlertRule:
-    """Defines conditions for triggering alerts."""
+    """Defines conditions for triggering alerts.
+    
+    ``categories`` and ``min_severity`` are cheap pre-filters checked before
+    ``condition``; a rule with no ``condition`` triggers whenever they match.
+    """
+    
+    __slots__ = (
+        "name", "condition", "severity", "cooldown_seconds", "enabled",
+        "categories", "min_rank", "last_triggered", "_last_triggered_mono",
+    )
     
     def __init__(
         self,
         name: str,
-        condition: callable,
+        condition: Optional[callable],
         severity: ErrorSeverity,
         cooldown_seconds: int = 300,
-        enabled: bool = True
+        enabled: bool = True,
+        categories: Optional[Iterable[ErrorCategory]] = None,
+        min_severity: Optional[ErrorSeverity] = None,
     ):
         self.name = name
         self.condition = condition
         self.severity = severity
         self.cooldown_seconds = cooldown_seconds
         self.enabled = enabled
+        self.categories = (
+            frozenset(categories) if categories is not None else None
+        )
+        self.min_rank = SEVERITY_RANK[min_severity] if min_severity is not None else None
         self.last_triggered: Optional[datetime] = None
+        self._last_triggered_mono: Optional[float] = None
     
     def should_trigger(self, error: ErrorEvent) -> bool:
         """Check if this rule should trigger for the given error."""
         if not self.enabled:
             return False
         
+        if self.categories is not None and error.category not in self.categories:
+            return False
+        if self.min_rank is not None and SEVERITY_RANK[error.severity] < self.min_rank:
+            return False
+        
         # Check cooldown
-        if self.last_triggered:
-            if (datetime.utcnow() - self.last_triggered).total_seconds() < self.cooldown_seconds:
+        now = time.monotonic()
+        if self._last_triggered_mono is not None:
+            if now - self._last_triggered_mono < self.cooldown_seconds:
                 return False
         
         # Check condition
-        if self.condition(error):
+        if self.condition is None or self.condition(error):
+            self._last_triggered_mono = now
             self.last_triggered = datetime.utcnow()
             return True
         
         return False
 
 
+def _seen_more_than_five_times(error: ErrorEvent) -> bool:
+    """Condition for the external_service_failures rule."""
+    return error.count > 5
+
+
 class ErrorTracker:
     """Main error tracking and alerting system."""
     
     def __init__(self):
         self.aggregator = ErrorAggregator()
         self.alert_rules: List[AlertRule] = []
+        # Rules that can match each category, in registration order; rebuilt
+        # as tuples whenever a rule is added
+        self._rules_by_category: Dict[ErrorCategory, Tuple[AlertRule, ...]] = {
+            category: () for category in ErrorCategory
+        }
         self.error_history = deque(maxlen=10000)  # Keep last 10k errors
+        # Per-minute occurrence counts for the last 24 hours, newest last
+        self._minute_buckets: deque[_MinuteBucket] = deque(maxlen=1440)
+        self._buckets_lock = threading.Lock()
         self.alert_handlers: List[callable] = []
+        # Pending (handlers, alert_data) pairs, drained by a single worker task
+        self._alert_queue: deque[Tuple[Tuple[Callable[..., Any], ...], Dict[str, Any]]] = (
+            deque(maxlen=10000)
+        )
+        self._alert_event: Optional[asyncio.Event] = None
+        self._alert_worker_task: Optional[asyncio.Task[None]] = None
+        # Error counter increments waiting to be flushed to Prometheus
+        self._metrics_buffer: Counter[Tuple[str, str, str]] = Counter()
+        self._metrics_lock = threading.Lock()
+        self._metrics_flush_task: Optional[asyncio.Task[None]] = None
         self._setup_default_rules()
     
     def _setup_default_rules(self):
@@ -186,15 +383,16 @@ class ErrorTracker:
         # Critical errors always alert
         self.add_alert_rule(
             name="critical_errors",
-            condition=lambda e: e.severity == ErrorSeverity.CRITICAL,
+            condition=None,
             severity=ErrorSeverity.CRITICAL,
-            cooldown_seconds=60
+            cooldown_seconds=60,
+            min_severity=ErrorSeverity.CRITICAL
         )
         
         # High error rate
         self.add_alert_rule(
             name="high_error_rate",
-            condition=lambda e: self._is_high_error_rate(e),
+            condition=self._is_high_error_rate,
             severity=ErrorSeverity.HIGH,
             cooldown_seconds=300
         )
@@ -202,33 +400,70 @@ class ErrorTracker:
         # Database errors
         self.add_alert_rule(
             name="database_errors",
-            condition=lambda e: e.category == ErrorCategory.DATABASE_ERROR and e.severity in [ErrorSeverity.HIGH, ErrorSeverity.CRITICAL],
+            condition=None,
             severity=ErrorSeverity.HIGH,
-            cooldown_seconds=180
+            cooldown_seconds=180,
+            categories={ErrorCategory.DATABASE_ERROR},
+            min_severity=ErrorSeverity.HIGH
         )
         
         # External service failures
         self.add_alert_rule(
             name="external_service_failures",
-            condition=lambda e: e.category == ErrorCategory.EXTERNAL_SERVICE_ERROR and e.count > 5,
+            condition=_seen_more_than_five_times,
             severity=ErrorSeverity.MEDIUM,
-            cooldown_seconds=300
+            cooldown_seconds=300,
+            categories={ErrorCategory.EXTERNAL_SERVICE_ERROR}
         )
     
+    def _record_occurrence(self, category: ErrorCategory, severity: ErrorSeverity) -> None:
+        """Count one error occurrence in the current minute's bucket."""
+        minute = int(time.time()) // 60
+        with self._buckets_lock:
+            if not self._minute_buckets or self._minute_buckets[-1].minute != minute:
+                self._minute_buckets.append(_MinuteBucket(minute))
+            bucket = self._minute_buckets[-1]
+            bucket.count += 1
+            bucket.categories[category] += 1
+            bucket.severities[severity] += 1
+    
+    def _recent_buckets(self, minutes: int) -> List[_MinuteBucket]:
+        """Return the buckets covering the last ``minutes`` minutes."""
+        oldest = int(time.time()) // 60 - minutes
+        recent = []
+        with self._buckets_lock:
+            for bucket in reversed(self._minute_buckets):
+                if bucket.minute <= oldest:
+                    break
+                recent.append(bucket)
+        return recent
+    
     def _is_high_error_rate(self, error: ErrorEvent) -> bool:
         """Check if we're experiencing a high error rate."""
         # Count errors in the last 5 minutes
-        cutoff = datetime.utcnow() - timedelta(minutes=5)
-        recent_errors = sum(
-            1 for e in self.error_history
-            if e.timestamp > cutoff
-        )
+        recent_errors = sum(bucket.count for bucket in self._recent_buckets(5))
         return recent_errors > 50  # More than 50 errors in 5 minutes
     
-    def add_alert_rule(self, name: str, condition: callable, severity: ErrorSeverity, cooldown_seconds: int = 300):
+    def add_alert_rule(
+        self,
+        name: str,
+        condition: Optional[callable],
+        severity: ErrorSeverity,
+        cooldown_seconds: int = 300,
+        categories: Optional[Iterable[ErrorCategory]] = None,
+        min_severity: Optional[ErrorSeverity] = None,
+    ):
         """Add a custom alert rule."""
-        rule = AlertRule(name, condition, severity, cooldown_seconds)
+        rule = AlertRule(
+            name, condition, severity, cooldown_seconds,
+            categories=categories, min_severity=min_severity,
+        )
         self.alert_rules.append(rule)
+        matched: Iterable[ErrorCategory] = ErrorCategory
+        if rule.categories is not None:
+            matched = rule.categories
+        for category in matched:
+            self._rules_by_category[category] += (rule,)
         logger.info(f"Added alert rule: {name}")
     
     def add_alert_handler(self, handler: callable):
@@ -247,50 +482,59 @@ class ErrorTracker:
         method: Optional[str] = None,
         user_id: Optional[str] = None
     ) -> ErrorEvent:
-        """Track an error event."""
-        import uuid
+        """Track an error event.
         
-        # Create error event
-        error = ErrorEvent(
-            id=str(uuid.uuid4()),
-            timestamp=datetime.utcnow(),
-            severity=severity,
-            category=category,
-            message=str(exception),
-            exception_type=exception.__class__.__name__,
-            stack_trace=traceback.format_exc(),
-            correlation_id=get_correlation_id(),
-            user_id=user_id,
-            component=component,
-            endpoint=endpoint,
-            method=method,
-            context=context or {}
-        )
+        Repeats of a known error only bump its counters; a new ``ErrorEvent`` is
+        built the first time a fingerprint is seen, and its stack trace is only
+        formatted if something reads it.
+        """
+        timestamp = datetime.utcnow()
+        fingerprint = _exception_fingerprint(exception, category, component)
         
         # Aggregate similar errors
-        aggregated_error = self.aggregator.add_error(error)
+        aggregated_error = self.aggregator.bump(fingerprint, timestamp, severity)
+        if aggregated_error is None:
+            error = ErrorEvent(
+                id=generate_id(),
+                timestamp=timestamp,
+                severity=severity,
+                category=category,
+                message=str(exception),
+                exception_type=exception.__class__.__name__,
+                tb_exception=traceback.TracebackException.from_exception(
+                    exception, lookup_lines=False
+                ),
+                correlation_id=get_correlation_id(),
+                user_id=user_id,
+                component=component,
+                endpoint=endpoint,
+                method=method,
+                context=context or {}
+            )
+            aggregated_error = self.aggregator.add_error(error, fingerprint)
         
         # Add to history
         self.error_history.append(aggregated_error)
+        self._record_occurrence(category, severity)
         
-        # Log the error
-        logger.error(
-            f"Error tracked: {exception}",
-            extra={
-                "error_id": error.id,
-                "severity": severity.value,
-                "category": category.value,
-                "component": component,
-                "exception_type": exception.__class__.__name__,
-                "context": context
-            }
-        )
+        # Log the error; skip building the record when ERROR is filtered out
+        if _stdlib_logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Error tracked",
+                extra={
+                    "error_id": aggregated_error.id,
+                    "error_message": aggregated_error.message,
+                    "severity": severity.value,
+                    "category": category.value,
+                    "component": component,
+                    "exception_type": exception.__class__.__name__,
+                    "context": context
+                }
+            )
         
         # Update metrics
-        MetricsCollector.record_error(
-            component=component or "unknown",
-            error_type=exception.__class__.__name__,
-            severity=severity.value
+        self._record_error_metric(
+            component or "unknown", exception.__class__.__name__, severity
         )
         
         # Check alert rules
@@ -298,9 +542,56 @@ class ErrorTracker:
         
         return aggregated_error
     
+    def _record_error_metric(self, component: str, error_type: str, severity: ErrorSeverity):
+        """Count an error in the Prometheus error counter.
+        
+        Inside a running event loop, increments are buffered and flushed about
+        once a second; critical errors and calls outside a loop are recorded
+        immediately.
+        """
+        if severity is not ErrorSeverity.CRITICAL:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None:
+                with self._metrics_lock:
+                    self._metrics_buffer[(component, error_type, severity.value)] += 1
+                task = self._metrics_flush_task
+                if task is None or task.done() or task.get_loop() is not loop:
+                    self._metrics_flush_task = loop.create_task(self._metrics_flusher())
+                return
+        
+        MetricsCollector.record_error(
+            component=component,
+            error_type=error_type,
+            severity=severity.value
+        )
+    
+    def flush_error_metrics(self) -> int:
+        """Push buffered error counts to Prometheus; returns the number of label sets flushed."""
+        with self._metrics_lock:
+            pending = self._metrics_buffer
+            self._metrics_buffer = Counter()
+        for (component, error_type, severity), count in pending.items():
+            MetricsCollector.record_error(
+                component=component,
+                error_type=error_type,
+                severity=severity,
+                count=count
+            )
+        return len(pending)
+    
+    async def _metrics_flusher(self, interval: float = 1.0) -> None:
+        """Flush buffered error metrics periodically until the buffer stays empty."""
+        while True:
+            await asyncio.sleep(interval)
+            if not self.flush_error_metrics():
+                return
+    
     def _check_alert_rules(self, error: ErrorEvent):
         """Check if any alert rules should trigger."""
-        for rule in self.alert_rules:
+        for rule in self._rules_by_category[error.category]:
             try:
                 if rule.should_trigger(error):
                     self._trigger_alert(rule, error)
@@ -318,12 +609,69 @@ class ErrorTracker:
         
         logger.warning(f"Alert triggered: {rule.name}", extra=alert_data)
         
-        # Call alert handlers
-        for handler in self.alert_handlers:
-            try:
-                asyncio.create_task(self._run_alert_handler(handler, alert_data))
-            except Exception as e:
-                logger.error(f"Error in alert handler {handler.__name__}: {e}")
+        if not self.alert_handlers:
+            return
+        
+        # Hand off to the worker; handlers run on the event loop, not here
+        try:
+            event = self._ensure_alert_worker()
+        except RuntimeError as e:
+            logger.error(f"Cannot dispatch alert {rule.name}: {e}")
+            return
+        self._alert_queue.append((tuple(self.alert_handlers), alert_data))
+        event.set()
+    
+    def _ensure_alert_worker(self) -> asyncio.Event:
+        """Start the alert worker on the running loop if it isn't already.
+        
+        Returns the event that wakes the worker. Raises RuntimeError when
+        called outside a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._alert_worker_task
+        event = self._alert_event
+        if task is not None and not task.done() and task.get_loop() is loop and event is not None:
+            return event
+        event = asyncio.Event()
+        self._alert_event = event
+        self._alert_worker_task = loop.create_task(self._alert_worker(event))
+        return event
+    
+    async def shutdown(self) -> None:
+        """Stop the background alert and metrics tasks and flush buffered metrics.
+        
+        Alerts still queued when this runs are dropped.
+        """
+        tasks = [
+            task for task in (self._alert_worker_task, self._metrics_flush_task)
+            if task is not None and not task.done()
+        ]
+        self._alert_worker_task = None
+        self._metrics_flush_task = None
+        self._alert_event = None
+        for task in tasks:
+            task.cancel()
+        loop = asyncio.get_running_loop()
+        # Tasks left behind on another (closed) loop can only be cancelled
+        await asyncio.gather(
+            *(task for task in tasks if task.get_loop() is loop), return_exceptions=True
+        )
+        self._alert_queue.clear()
+        self.flush_error_metrics()
+    
+    async def _alert_worker(self, event: asyncio.Event) -> None:
+        """Drain queued alerts in batches, running their handlers concurrently."""
+        while True:
+            await event.wait()
+            event.clear()
+            while self._alert_queue:
+                batch: List[Awaitable[None]] = []
+                while self._alert_queue:
+                    handlers, alert_data = self._alert_queue.popleft()
+                    batch.extend(
+                        self._run_alert_handler(handler, alert_data) for handler in handlers
+                    )
+                await asyncio.gather(*batch, return_exceptions=True)
     
     async def _run_alert_handler(self, handler: callable, alert_data: Dict[str, Any]):
         """Run an alert handler asynchronously."""
@@ -337,28 +685,31 @@ class ErrorTracker:
     
     def get_error_statistics(self) -> Dict[str, Any]:
         """Get error statistics for monitoring."""
-        cutoff_1h = datetime.utcnow() - timedelta(hours=1)
-        cutoff_24h = datetime.utcnow() - timedelta(hours=24)
-        
-        recent_errors_1h = [e for e in self.error_history if e.timestamp > cutoff_1h]
-        recent_errors_24h = [e for e in self.error_history if e.timestamp > cutoff_24h]
+        buckets_24h = self._recent_buckets(24 * 60)
+        # Buckets come newest first, so the last hour is a prefix of the 24h list
+        hour_cutoff = int(time.time()) // 60 - 60
+        errors_last_hour = 0
+        errors_last_24h = 0
         
         # Group by category and severity
-        category_counts = defaultdict(int)
-        severity_counts = defaultdict(int)
+        category_counts = Counter()
+        severity_counts = Counter()
         
-        for error in recent_errors_24h:
-            category_counts[error.category.value] += error.count
-            severity_counts[error.severity.value] += error.count
+        for bucket in buckets_24h:
+            errors_last_24h += bucket.count
+            if bucket.minute > hour_cutoff:
+                errors_last_hour += bucket.count
+            category_counts.update(bucket.categories)
+            severity_counts.update(bucket.severities)
         
         return {
             "total_errors": len(self.error_history),
-            "errors_last_hour": len(recent_errors_1h),
-            "errors_last_24h": len(recent_errors_24h),
-            "error_rate_per_hour": len(recent_errors_1h),
-            "category_breakdown": dict(category_counts),
-            "severity_breakdown": dict(severity_counts),
-            "unique_errors": len(self.aggregator.errors),
+            "errors_last_hour": errors_last_hour,
+            "errors_last_24h": errors_last_24h,
+            "error_rate_per_hour": errors_last_hour,
+            "category_breakdown": {category.value: n for category, n in category_counts.items()},
+            "severity_breakdown": {severity.value: n for severity, n in severity_counts.items()},
+            "unique_errors": len(self.aggregator),
             "alert_rules": len(self.alert_rules),
         }
 
@@ -415,6 +766,8 @@ def track_error(
 # Default alert handlers
 async def log_alert_handler(alert_data: Dict[str, Any]):
     """Default alert handler that logs alerts."""
+    if not _stdlib_logger.isEnabledFor(logging.WARNING):
+        return
     logger.warning(
         f"ALERT: {alert_data['rule_name']}",
         extra={
@@ -4,18 +4,27 @@ import logging
 import logging.config
 import os
 import sys
-import uuid
 from typing import Any, Dict, Optional
 
+import orjson
 import structlog
 from opentelemetry import trace
 
 # Context variables for request tracking
-correlation_id_var: contextvars.ContextVar[str] = contextvars.ContextVar('correlation_id')
+correlation_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('correlation_id', default=None)
 user_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('user_id', default=None)
 request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('request_id', default=None)
 
 
+def _orjson_dumps(obj: Any, default: Any = None, **kwargs: Any) -> str:
+    """Serializer for structlog's JSONRenderer backed by orjson."""
+    return orjson.dumps(
+        obj,
+        default=default,
+        option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
 def setup_logging() -> None:
     """Configure structured logging with OpenTelemetry integration."""
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -28,13 +37,12 @@ def setup_logging() -> None:
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
+            render_exception_info,
             structlog.processors.UnicodeDecoder(),
             add_correlation_context,
             add_trace_info,
             add_service_context,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -48,7 +56,7 @@ def setup_logging() -> None:
         "formatters": {
             "json": {
                 "()": structlog.stdlib.ProcessorFormatter,
-                "processor": structlog.processors.JSONRenderer(),
+                "processor": structlog.processors.JSONRenderer(serializer=_orjson_dumps),
             },
             "console": {
                 "()": structlog.stdlib.ProcessorFormatter,
@@ -84,30 +92,39 @@ def setup_logging() -> None:
     logging.config.dictConfig(logging_config)
 
 
+def generate_id() -> str:
+    """Return a random 128-bit identifier as 32 hex characters."""
+    return os.urandom(16).hex()
+
+
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+
+def render_exception_info(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Render ``stack_info``/``exc_info`` when present, returning early for plain records."""
+    if "exc_info" not in event_dict and "stack_info" not in event_dict:
+        return event_dict
+    
+    event_dict = _stack_info_renderer(logger, method_name, event_dict)
+    return structlog.processors.format_exc_info(logger, method_name, event_dict)
+
+
 def add_correlation_context(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
     """Add correlation and request context to log records."""
-    try:
-        correlation_id = correlation_id_var.get()
-        event_dict["correlation_id"] = correlation_id
-    except LookupError:
+    correlation_id = correlation_id_var.get(None)
+    if correlation_id is None:
         # Generate new correlation ID if not set
-        correlation_id = str(uuid.uuid4())
+        correlation_id = generate_id()
         correlation_id_var.set(correlation_id)
-        event_dict["correlation_id"] = correlation_id
-    
-    try:
-        user_id = user_id_var.get()
-        if user_id:
-            event_dict["user_id"] = user_id
-    except LookupError:
-        pass
-    
-    try:
-        request_id = request_id_var.get()
-        if request_id:
-            event_dict["request_id"] = request_id
-    except LookupError:
-        pass
+    event_dict["correlation_id"] = correlation_id
+    
+    user_id = user_id_var.get(None)
+    if user_id:
+        event_dict["user_id"] = user_id
+    
+    request_id = request_id_var.get(None)
+    if request_id:
+        event_dict["request_id"] = request_id
     
     return event_dict
 
@@ -154,12 +171,11 @@ def set_correlation_id(correlation_id: str) -> None:
 
 def get_correlation_id() -> str:
     """Get or generate a correlation ID for the current context."""
-    try:
-        return correlation_id_var.get()
-    except LookupError:
-        correlation_id = str(uuid.uuid4())
+    correlation_id = correlation_id_var.get(None)
+    if correlation_id is None:
+        correlation_id = generate_id()
         correlation_id_var.set(correlation_id)
-        return correlation_id
+    return correlation_id
 
 
 def set_user_context(user_id: Optional[str] = None, request_id: Optional[str] = None) -> None:
@@ -173,21 +189,28 @@ def set_user_context(user_id: Optional[str] = None, request_id: Optional[str] =
 def clear_context() -> None:
     """Clear all context variables."""
     for var in [correlation_id_var, user_id_var, request_id_var]:
-        try:
-            var.delete()
-        except LookupError:
-            pass
+        var.set(None)
 
 
 class LoggerMixin:
-    """Mixin to provide logger functionality to classes."""
+    """Mixin to provide logger functionality to classes.
+    
+    The logger is created once per class when it is defined, not per instance.
+    """
+    
+    _class_logger: structlog.stdlib.BoundLogger
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._class_logger = get_logger(f"{cls.__module__}.{cls.__name__}")
     
     @property
     def logger(self) -> structlog.stdlib.BoundLogger:
         """Get logger for this class."""
-        if not hasattr(self, '_logger'):
-            self._logger = get_logger(f"{self.__class__.__module__}.{self.__class__.__name__}")
-        return self._logger
+        return type(self)._class_logger
+
+
+LoggerMixin._class_logger = get_logger(f"{LoggerMixin.__module__}.{LoggerMixin.__name__}")
 
 
 # Application-specific loggers
@@ -1,5 +1,6 @@
 """Prometheus metrics configuration and collection."""
 import time
+from functools import lru_cache
 from typing import Dict, Optional
 
 from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry, generate_latest
@@ -116,17 +117,19 @@ ERROR_RATE = Counter(
     registry=REGISTRY
 )
 
+# Status is left off the histogram and collapsed to its class (2xx, 4xx, ...)
+# on the counter, so each endpoint doesn't fan out into a series per code.
 HTTP_REQUEST_DURATION = Histogram(
     'http_request_duration_seconds',
     'HTTP request duration',
-    ['method', 'endpoint', 'status_code'],
+    ['method', 'endpoint'],
     registry=REGISTRY
 )
 
 HTTP_REQUESTS_TOTAL = Counter(
     'http_requests_total',
     'Total HTTP requests',
-    ['method', 'endpoint', 'status_code'],
+    ['method', 'endpoint', 'status_class'],
     registry=REGISTRY
 )
 
@@ -172,6 +175,68 @@ EXTERNAL_SERVICE_HEALTH = Gauge(
 )
 
 
+# Bound metric children for hot-path label sets. Resolving .labels() hashes
+# the label values and takes the metric's lock on every call; caching the
+# child skips that. The cache bound keeps runaway label values from pinning
+# unbounded memory here (the series still exist in the metric itself).
+_CHILD_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CHILD_CACHE_SIZE)
+def _creative_requests(format: str, phase: str, status: str) -> Counter:
+    return CREATIVE_PROCESSING_REQUESTS.labels(format, phase, status)
+
+
+@lru_cache(maxsize=_CHILD_CACHE_SIZE)
+def _creative_duration(format: str, phase: str) -> Histogram:
+    return CREATIVE_PROCESSING_DURATION.labels(format, phase)
+
+
+@lru_cache(maxsize=_CHILD_CACHE_SIZE)
+def _amazon_requests(endpoint: str, method: str, status_code: int) -> Counter:
+    return AMAZON_DSP_API_REQUESTS.labels(endpoint, method, str(status_code))
+
+
+@lru_cache(maxsize=_CHILD_CACHE_SIZE)
+def _amazon_duration(endpoint: str, method: str) -> Histogram:
+    return AMAZON_DSP_API_DURATION.labels(endpoint, method)
+
+
+@lru_cache(maxsize=_CHILD_CACHE_SIZE)
+def _kargo_requests(endpoint: str, status_code: int) -> Counter:
+    return KARGO_API_REQUESTS.labels(endpoint, str(status_code))
+
+
+@lru_cache(maxsize=_CHILD_CACHE_SIZE)
+def _kargo_duration(endpoint: str) -> Histogram:
+    return KARGO_API_DURATION.labels(endpoint)
+
+
+@lru_cache(maxsize=_CHILD_CACHE_SIZE)
+def _database_operations(operation: str, table: str, status: str) -> Counter:
+    return DATABASE_OPERATIONS.labels(operation, table, status)
+
+
+@lru_cache(maxsize=_CHILD_CACHE_SIZE)
+def _database_duration(operation: str, table: str) -> Histogram:
+    return DATABASE_OPERATION_DURATION.labels(operation, table)
+
+
+@lru_cache(maxsize=_CHILD_CACHE_SIZE)
+def _http_requests(method: str, endpoint: str, status_class: str) -> Counter:
+    return HTTP_REQUESTS_TOTAL.labels(method, endpoint, status_class)
+
+
+@lru_cache(maxsize=_CHILD_CACHE_SIZE)
+def _http_duration(method: str, endpoint: str) -> Histogram:
+    return HTTP_REQUEST_DURATION.labels(method, endpoint)
+
+
+@lru_cache(maxsize=_CHILD_CACHE_SIZE)
+def _cache_operations(operation: str, cache_type: str, result: str) -> Counter:
+    return CACHE_OPERATIONS.labels(operation, cache_type, result)
+
+
 def setup_metrics() -> None:
     """Setup OpenTelemetry metrics with Prometheus exporter."""
     # Create resource
@@ -199,16 +264,8 @@ class MetricsCollector:
         status: str = "success"
     ) -> None:
         """Record creative processing metrics."""
-        CREATIVE_PROCESSING_REQUESTS.labels(
-            format=format, 
-            phase=phase, 
-            status=status
-        ).inc()
-        
-        CREATIVE_PROCESSING_DURATION.labels(
-            format=format, 
-            phase=phase
-        ).observe(duration)
+        _creative_requests(format, phase, status).inc()
+        _creative_duration(format, phase).observe(duration)
     
     @staticmethod
     def record_campaign_operation(operation: str, status: str = "success") -> None:
@@ -232,16 +289,8 @@ class MetricsCollector:
         duration: float
     ) -> None:
         """Record Amazon DSP API request metrics."""
-        AMAZON_DSP_API_REQUESTS.labels(
-            endpoint=endpoint, 
-            method=method, 
-            status_code=str(status_code)
-        ).inc()
-        
-        AMAZON_DSP_API_DURATION.labels(
-            endpoint=endpoint, 
-            method=method
-        ).observe(duration)
+        _amazon_requests(endpoint, method, status_code).inc()
+        _amazon_duration(endpoint, method).observe(duration)
     
     @staticmethod
     def record_kargo_request(
@@ -250,12 +299,8 @@ class MetricsCollector:
         duration: float
     ) -> None:
         """Record Kargo API request metrics."""
-        KARGO_API_REQUESTS.labels(
-            endpoint=endpoint, 
-            status_code=str(status_code)
-        ).inc()
-        
-        KARGO_API_DURATION.labels(endpoint=endpoint).observe(duration)
+        _kargo_requests(endpoint, status_code).inc()
+        _kargo_duration(endpoint).observe(duration)
     
     @staticmethod
     def record_database_operation(
@@ -265,16 +310,8 @@ class MetricsCollector:
         status: str = "success"
     ) -> None:
         """Record database operation metrics."""
-        DATABASE_OPERATIONS.labels(
-            operation=operation, 
-            table=table, 
-            status=status
-        ).inc()
-        
-        DATABASE_OPERATION_DURATION.labels(
-            operation=operation, 
-            table=table
-        ).observe(duration)
+        _database_operations(operation, table, status).inc()
+        _database_duration(operation, table).observe(duration)
     
     @staticmethod
     def set_active_campaigns(count: int) -> None:
@@ -295,13 +332,13 @@ class MetricsCollector:
         ).inc()
     
     @staticmethod
-    def record_error(component: str, error_type: str, severity: str = "error") -> None:
+    def record_error(component: str, error_type: str, severity: str = "error", count: int = 1) -> None:
         """Record application errors."""
         ERROR_RATE.labels(
             component=component, 
             error_type=error_type,
             severity=severity
-        ).inc()
+        ).inc(count)
     
     @staticmethod
     def record_http_request(
@@ -311,17 +348,8 @@ class MetricsCollector:
         duration: float
     ) -> None:
         """Record HTTP request metrics."""
-        HTTP_REQUESTS_TOTAL.labels(
-            method=method,
-            endpoint=endpoint,
-            status_code=str(status_code)
-        ).inc()
-        
-        HTTP_REQUEST_DURATION.labels(
-            method=method,
-            endpoint=endpoint,
-            status_code=str(status_code)
-        ).observe(duration)
+        _http_requests(method, endpoint, f"{status_code // 100}xx").inc()
+        _http_duration(method, endpoint).observe(duration)
     
     @staticmethod
     def set_concurrent_requests(count: int) -> None:
@@ -340,11 +368,7 @@ class MetricsCollector:
         result: str
     ) -> None:
         """Record cache operation metrics."""
-        CACHE_OPERATIONS.labels(
-            operation=operation,
-            cache_type=cache_type,
-            result=result
-        ).inc()
+        _cache_operations(operation, cache_type, result).inc()
     
     @staticmethod
     def set_background_tasks(task_type: str, status: str, count: int) -> None:
@@ -385,11 +409,11 @@ class TimingContext:
         self.start_time = None
     
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = time.time() - self.start_time
+        duration = (time.perf_counter_ns() - self.start_time) * 1e-9
         
         # Determine status based on exception
         status = "error" if exc_type else "success"
@@ -1,6 +1,6 @@
 """Validation utilities for creative processing and campaign management."""
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 from app.models.creative import CreativeFormat, ViewabilityPhase, ViewabilityVendor
@@ -133,7 +133,7 @@ class CreativeValidator:
     def validate_phase_configuration(
         cls, 
         phase: ViewabilityPhase, 
-        vendors: List[ViewabilityVendor],
+        vendors: Sequence[ViewabilityVendor],
         creative_code: str
     ) -> List[str]:
         """
@@ -128,7 +128,6 @@ def sample_associations(sample_campaign, sample_creatives):
 class TestBulkSheetGenerator:
     """Test bulk sheet generator functionality."""
     
-    @pytest.mark.asyncio
     async def test_generate_excel_bulk_sheet(
         self,
         bulk_generator,
@@ -176,7 +175,6 @@ class TestBulkSheetGenerator:
         assert sample_campaign.bulk_sheet_path == response.file_path
         mock_db_session.commit.assert_called()
     
-    @pytest.mark.asyncio
     async def test_generate_csv_bulk_sheet(
         self,
         bulk_generator,
@@ -223,7 +221,6 @@ class TestBulkSheetGenerator:
         assert os.path.exists(f"{base_path}_creatives.csv")
         assert os.path.exists(f"{base_path}_line_items.csv")
     
-    @pytest.mark.asyncio
     async def test_generate_bulk_sheet_campaign_not_found(
         self,
         bulk_generator,
@@ -240,7 +237,6 @@ class TestBulkSheetGenerator:
         with pytest.raises(ValueError, match="Campaign not found"):
             await bulk_generator.generate_bulk_sheet(request)
     
-    @pytest.mark.asyncio
     async def test_minimal_bulk_sheet_generation(
         self,
         bulk_generator,
@@ -422,7 +418,6 @@ class TestBulkSheetGenerator:
         assert all(df["Campaign ID"] == "camp_123")
         assert all(df["Line Item ID"].str.startswith("camp_123_LI_"))
     
-    @pytest.mark.asyncio
     async def test_download_bulk_sheet(
         self,
         bulk_generator,
@@ -442,7 +437,6 @@ class TestBulkSheetGenerator:
         # Assertions
         assert content == test_content
     
-    @pytest.mark.asyncio
     async def test_download_bulk_sheet_not_found(
         self,
         bulk_generator
@@ -451,7 +445,6 @@ class TestBulkSheetGenerator:
         with pytest.raises(FileNotFoundError):
             await bulk_generator.download_bulk_sheet("/nonexistent/path.xlsx")
     
-    @pytest.mark.asyncio
     async def test_list_bulk_sheets(
         self,
         bulk_generator,
@@ -80,7 +80,6 @@ def mock_processed_creative():
 class TestCampaignManager:
     """Test campaign manager functionality."""
     
-    @pytest.mark.asyncio
     async def test_create_campaign_success(
         self,
         campaign_manager,
@@ -112,7 +111,6 @@ class TestCampaignManager:
         mock_db_session.add.assert_called()
         mock_db_session.commit.assert_called()
     
-    @pytest.mark.asyncio
     async def test_create_campaign_missing_creatives(
         self,
         campaign_manager,
@@ -127,7 +125,6 @@ class TestCampaignManager:
         with pytest.raises(ValueError, match="Creatives not found"):
             await campaign_manager.create_campaign(sample_campaign_request)
     
-    @pytest.mark.asyncio
     async def test_get_campaign_success(
         self,
         campaign_manager,
@@ -162,7 +159,6 @@ class TestCampaignManager:
         assert result.name == "Test Campaign"
         assert result.amazon_order_id == "order_123"
     
-    @pytest.mark.asyncio
     async def test_get_campaign_not_found(
         self,
         campaign_manager,
@@ -174,7 +170,6 @@ class TestCampaignManager:
         with pytest.raises(ValueError, match="Campaign not found"):
             await campaign_manager.get_campaign("nonexistent")
     
-    @pytest.mark.asyncio
     async def test_update_campaign_success(
         self,
         campaign_manager,
@@ -213,7 +208,6 @@ class TestCampaignManager:
         assert result.budget == 15000.0
         mock_db_session.commit.assert_called()
     
-    @pytest.mark.asyncio
     async def test_activate_campaign_success(
         self,
         campaign_manager,
@@ -246,7 +240,6 @@ class TestCampaignManager:
         assert result.status == "active"
         mock_db_session.commit.assert_called()
     
-    @pytest.mark.asyncio
     async def test_activate_campaign_not_ready(
         self,
         campaign_manager,
@@ -276,7 +269,6 @@ class TestCampaignManager:
         with pytest.raises(ValueError, match="Campaign not synced with Amazon DSP"):
             await campaign_manager.activate_campaign("camp_123")
     
-    @pytest.mark.asyncio
     async def test_list_campaigns_with_filters(
         self,
         campaign_manager,
@@ -327,7 +319,6 @@ class TestCampaignManager:
         assert len(result) == 2  # Mock returns all, filter would be in query
         assert all(isinstance(campaign, CampaignResponse) for campaign in result)
     
-    @pytest.mark.asyncio
     async def test_add_creatives_to_campaign(
         self,
         campaign_manager,
@@ -372,7 +363,6 @@ class TestCampaignManager:
         mock_db_session.add.assert_called()
         mock_db_session.commit.assert_called()
     
-    @pytest.mark.asyncio
     async def test_delete_campaign_success(
         self,
         campaign_manager,
@@ -405,7 +395,6 @@ class TestCampaignManager:
         assert mock_campaign.status == "deleted"
         mock_db_session.commit.assert_called()
     
-    @pytest.mark.asyncio
     async def test_delete_active_campaign_fails(
         self,
         campaign_manager,